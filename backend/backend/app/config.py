@@ -0,0 +1,41 @@
+"""Application settings, read from the environment once at import."""
+
+import os
+from dataclasses import dataclass
+
+
+def _env_region() -> str:
+    return os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "us-east-1"
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Deployment configuration. Values are fixed for the lifetime of the process."""
+
+    ARTIFACTS_TABLE_NAME: str = os.environ.get("ARTIFACTS_TABLE_NAME", "artifacts")
+    AWS_REGION: str = _env_region()
+    # DynamoDB Accelerator cluster endpoint; DAX is used only when this is set.
+    DAX_ENDPOINT: str | None = os.environ.get("DAX_ENDPOINT") or None
+    # Upper bound on items requested from DynamoDB by a single list call.
+    MAX_ARTIFACTS_PER_REQUEST: int = int(os.environ.get("MAX_ARTIFACTS_PER_REQUEST", "100"))
+    # Items requested per DynamoDB page when a handler walks every matching page.
+    DEFAULT_PAGE_SIZE: int = int(os.environ.get("DEFAULT_PAGE_SIZE", "100"))
+    # Global secondary index keyed on the artifact name (see template.yaml).
+    NAME_INDEX_NAME: str = os.environ.get("ARTIFACTS_NAME_INDEX", "name-index")
+    # Parallel-scan segments used when a request has to walk the whole table.
+    SCAN_SEGMENTS: int = int(os.environ.get("SCAN_SEGMENTS", "4"))
+    # Open the DynamoDB connection during container init. On by default only inside Lambda,
+    # where init time is separate from the first request.
+    WARM_DYNAMODB_CONNECTION: bool = os.environ.get(
+        "WARM_DYNAMODB_CONNECTION", "1" if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") else "0"
+    ) in ("1", "true", "True")
+    # Level for the app's loggers; DEBUG records are dropped before formatting unless set.
+    LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "INFO").upper()
+
+
+_SETTINGS = Settings()
+
+
+def get_settings() -> Settings:
+    """Return the process-wide settings."""
+    return _SETTINGS
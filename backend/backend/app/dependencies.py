@@ -1,13 +1,19 @@
 """Dependencies for authentication and common functionality."""
 
+import logging
+import threading
+from functools import lru_cache
 from typing import Annotated
 from fastapi import Header
-import os
 import boto3
 from boto3.resources.base import ServiceResource
+from botocore.config import Config
 
+from .config import get_settings
 from .models import AuthenticationToken
 
+logger = logging.getLogger(__name__)
+
 
 async def get_auth_token(
     x_authorization: Annotated[str, Header(alias="X-Authorization")],
@@ -24,18 +30,73 @@ async def get_optional_auth_token(
     return x_authorization
 
 
-def _create_dynamodb_resource() -> ServiceResource:
-    """Create a DynamoDB resource with a default region for local/dev."""
-    region = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "us-east-1"
-    return boto3.resource("dynamodb", region_name=region)
+# Room for the reset's 32 batch writers plus parallel scans and list fan-out without
+# waiting on urllib3's default pool of 10; adaptive retries back off on throttling.
+# Calls run on worker threads, so tight timeouts keep a stalled socket from pinning one.
+# TCP keep-alive stops idle pooled connections (e.g. in a frozen Lambda) from being dropped
+# silently and forcing a fresh TLS handshake on the next call.
+_DYNAMODB_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=10,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+@lru_cache(maxsize=1)
+def _boto3_session() -> boto3.session.Session:
+    """One boto3 session per process, so credentials and connection pools are shared."""
+    return boto3.session.Session(region_name=get_settings().AWS_REGION)
+
+
+@lru_cache(maxsize=1)
+def _dynamodb_resource() -> ServiceResource:
+    """Create the process-wide DynamoDB resource.
+
+    When DAX_ENDPOINT is set, the resource talks to that DynamoDB Accelerator
+    cluster instead. DAX is API-compatible and write-through, so callers are unchanged.
+    """
+    settings = get_settings()
+    if settings.DAX_ENDPOINT:
+        # Optional dependency, only needed by deployments that run a DAX cluster.
+        from amazondax import AmazonDaxClient
+
+        return AmazonDaxClient.resource(
+            endpoint_url=settings.DAX_ENDPOINT, region_name=settings.AWS_REGION
+        )
+    return _boto3_session().resource("dynamodb", config=_DYNAMODB_CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=1)
+def _get_table():
+    """Build the artifacts Table object once per process."""
+    table_name = get_settings().ARTIFACTS_TABLE_NAME
+    return _dynamodb_resource().Table(table_name)  # type: ignore[reportAttributeAccessIssue]
+
+
+def _warm_connection() -> None:
+    """Open a pooled connection to DynamoDB with a GetItem for a key that never exists."""
+    try:
+        _get_table().get_item(Key={"id": "__warmup__"}, ProjectionExpression="id")
+    except Exception:  # noqa: BLE001
+        logger.debug("DynamoDB connection warm-up failed", exc_info=True)
 
 
-_dynamodb = _create_dynamodb_resource()
+# Build the Table at import so the first request (Lambda cold start) doesn't pay for it.
+_get_table()
+# The TCP/TLS handshake runs on a side thread that import waits for only briefly: long
+# enough to finish on a healthy network during Lambda init, never long enough for an
+# unreachable table to stall or fail the import. Failures are logged and otherwise ignored.
+_WARMUP_WAIT_SECONDS = 0.5
+if get_settings().WARM_DYNAMODB_CONNECTION:
+    _warmup = threading.Thread(target=_warm_connection, name="dynamodb-warmup", daemon=True)
+    _warmup.start()
+    _warmup.join(_WARMUP_WAIT_SECONDS)
 
 
 async def get_dynamodb_table():
     """
     Provide a DynamoDB table reference for dependencies.
     """
-    table_name = os.environ.get("ARTIFACTS_TABLE_NAME", "artifacts")
-    return _dynamodb.Table(table_name)  # type: ignore[reportAttributeAccessIssue]
+    return _get_table()
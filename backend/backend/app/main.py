@@ -2,10 +2,15 @@
 ECE 461 - Fall 2025 - Project Phase 2 - Group 112
 """
 
+import gzip
+
 from fastapi import FastAPI, Request
-from fastapi.responses import RedirectResponse, Response
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 import yaml
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import IdentityResponder
 from .routers import (
     artifacts,
     ingest,
@@ -21,14 +26,60 @@ from .routers import (
     tracks,
     health,
 )
+from .config import get_settings
+from .utils.log import configure_logging
+
+try:  # libyaml-backed emitter when PyYAML was built with it
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+configure_logging(__package__, get_settings().LOG_LEVEL)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip; an explicit q=0 refuses it."""
+    wildcard = None
+    for entry in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in entry.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        coding = coding.lower()
+        if coding == "gzip":
+            return quality > 0
+        if coding == "*":
+            wildcard = quality > 0
+    return bool(wildcard)
+
+
+class _GZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves the body alone for clients refusing gzip with q=0."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and not _accepts_gzip(
+            Headers(scope=scope).get("accept-encoding", "")
+        ):
+            await IdentityResponder(self.app, self.minimum_size)(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 
 app = FastAPI(
     title="ECE 461 - Fall 2025 - Project Phase 2 - Group 112",
     version="3.4.7",
     description="API for ECE 461/Fall 2025/Project Phase 2 - Group 112",
     redirect_slashes=False,  # Disable automatic trailing slash redirects
+    default_response_class=ORJSONResponse,
 )
 
+# Compress larger JSON bodies (artifact lists, lineage graphs) for clients that accept gzip.
+app.add_middleware(_GZipMiddleware, minimum_size=1024, compresslevel=5)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -51,17 +102,28 @@ app.include_router(license.router)
 app.include_router(tracks.router)
 app.include_router(ingest.router)
 
-openapi_yaml: str | None = None
+openapi_yaml: bytes | None = None
+openapi_yaml_gzip: bytes | None = None
 
 
 @app.get("/yaml", response_class=Response, include_in_schema=False)
-def get_openapi_yaml():
-    global openapi_yaml
+def get_openapi_yaml(request: Request):
+    global openapi_yaml, openapi_yaml_gzip
     if openapi_yaml is None:
         openapi_spec = app.openapi()
-        openapi_yaml = yaml.dump(openapi_spec, default_flow_style=False)
+        spec = yaml.dump(openapi_spec, Dumper=_YamlDumper, default_flow_style=False).encode()
+        openapi_yaml_gzip = gzip.compress(spec, 6)
+        openapi_yaml = spec
 
-    return Response(content=openapi_yaml, media_type="application/yaml")
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=openapi_yaml_gzip,
+            media_type="application/yaml",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=openapi_yaml, media_type="application/yaml", headers={"Vary": "Accept-Encoding"}
+    )
 
 
 @app.get("/", include_in_schema=False)
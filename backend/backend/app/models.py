@@ -6,6 +6,16 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl, StringConstraints
 
 
+class RegistryModel(BaseModel):
+    """Base for all API schemas.
+
+    Core schemas are built on first use rather than at import, and instances are
+    immutable once constructed.
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+
 # Basic Types
 class ArtifactType(str, Enum):
     """Artifact category."""
@@ -15,6 +25,10 @@ class ArtifactType(str, Enum):
     code = "code"
 
 
+# Plain dict lookup for turning stored type strings into ArtifactType members.
+ARTIFACT_TYPE_BY_VALUE: dict[str, ArtifactType] = {t.value: t for t in ArtifactType}
+
+
 # Unique identifier for the artifact - must contain only alphanumeric characters and hyphens
 ArtifactID = Annotated[
     str,
@@ -31,14 +45,14 @@ ActionType = Literal["CREATE", "UPDATE", "DOWNLOAD", "RATE", "AUDIT"]
 
 
 # User Models
-class User(BaseModel):
+class User(RegistryModel):
     """User information."""
 
     name: str = Field(description="Username", examples=["Alfalfa"])
     is_admin: bool = Field(description="Is this user an admin?", examples=[True])
 
 
-class UserAuthenticationInfo(BaseModel):
+class UserAuthenticationInfo(RegistryModel):
     """Authentication info for a user."""
 
     password: str = Field(
@@ -47,7 +61,7 @@ class UserAuthenticationInfo(BaseModel):
     )
 
 
-class AuthenticationRequest(BaseModel):
+class AuthenticationRequest(RegistryModel):
     """Authentication request payload."""
 
     user: User
@@ -55,7 +69,7 @@ class AuthenticationRequest(BaseModel):
 
 
 # Artifact Models
-class ArtifactData(BaseModel):
+class ArtifactData(RegistryModel):
     """Source location for ingesting an artifact.
 
     Provide a single downloadable url pointing to a bundle that contains the artifact assets.
@@ -76,7 +90,7 @@ class ArtifactData(BaseModel):
     )
 
 
-class ArtifactMetadata(BaseModel):
+class ArtifactMetadata(RegistryModel):
     """The `name` is provided when uploading an artifact.
 
     The `id` is used as an internal identifier for interacting with existing artifacts and distinguishes artifacts that share a name.
@@ -87,14 +101,14 @@ class ArtifactMetadata(BaseModel):
     type: ArtifactType = Field(description="Type of artifact", examples=["model"])
 
 
-class Artifact(BaseModel):
+class Artifact(RegistryModel):
     """Artifact envelope containing metadata and ingest details."""
 
     metadata: ArtifactMetadata
     data: ArtifactData
 
 
-class ArtifactQuery(BaseModel):
+class ArtifactQuery(RegistryModel):
     """Query parameters for searching artifacts."""
 
     name: ArtifactName = Field(description="Name of artifact to query")
@@ -103,14 +117,14 @@ class ArtifactQuery(BaseModel):
     )
 
 
-class ArtifactRegEx(BaseModel):
+class ArtifactRegEx(RegistryModel):
     """Regular expression query for artifacts."""
 
     regex: str = Field(description="A regular expression over artifact names and READMEs")
 
 
 # Audit Models
-class ArtifactAuditEntry(BaseModel):
+class ArtifactAuditEntry(RegistryModel):
     """One entry in an artifact's audit history."""
 
     user: User
@@ -123,7 +137,7 @@ class ArtifactAuditEntry(BaseModel):
 
 
 # Lineage Models
-class ArtifactLineageNode(BaseModel):
+class ArtifactLineageNode(RegistryModel):
     """A single node in an artifact lineage graph."""
 
     artifact_id: ArtifactID = Field(description="Unique identifier for the node")
@@ -138,7 +152,7 @@ class ArtifactLineageNode(BaseModel):
     )
 
 
-class ArtifactLineageEdge(BaseModel):
+class ArtifactLineageEdge(RegistryModel):
     """Directed relationship between two lineage nodes."""
 
     from_node_artifact_id: ArtifactID = Field(description="Identifier of the upstream node")
@@ -148,7 +162,7 @@ class ArtifactLineageEdge(BaseModel):
     )
 
 
-class ArtifactLineageGraph(BaseModel):
+class ArtifactLineageGraph(RegistryModel):
     """Complete lineage graph for an artifact."""
 
     nodes: list[ArtifactLineageNode] = Field(
@@ -160,14 +174,14 @@ class ArtifactLineageGraph(BaseModel):
 
 
 # License Check Models
-class SimpleLicenseCheckRequest(BaseModel):
+class SimpleLicenseCheckRequest(RegistryModel):
     """Request payload for artifact license compatibility analysis."""
 
     github_url: HttpUrl = Field(description="GitHub repository url to evaluate")
 
 
 # Rating Models
-class SizeScore(BaseModel):
+class SizeScore(RegistryModel):
     """Size suitability scores for common deployment targets."""
 
     raspberry_pi: float = Field(description="Size score for Raspberry Pi class devices")
@@ -176,7 +190,7 @@ class SizeScore(BaseModel):
     aws_server: float = Field(description="Size score for cloud server deployments")
 
 
-class ModelRating(BaseModel):
+class ModelRating(RegistryModel):
     """Model rating summary generated by the evaluation service."""
 
     name: str = Field(description="Human-friendly label for the evaluated model")
@@ -228,7 +242,7 @@ class ModelRating(BaseModel):
 
 
 # Cost Models
-class ArtifactCostDetail(BaseModel):
+class ArtifactCostDetail(RegistryModel):
     """Cost details for a single artifact."""
 
     standalone_cost: Optional[float] = Field(
@@ -241,7 +255,7 @@ ArtifactCost = dict[ArtifactID, ArtifactCostDetail]
 
 
 # Tracks Model
-class TracksResponse(BaseModel):
+class TracksResponse(RegistryModel):
     """Response containing planned implementation tracks."""
 
     plannedTracks: list[str] = Field(description="List of tracks the student plans to implement")
@@ -252,7 +266,7 @@ HealthStatus = Literal["ok", "degraded", "critical", "unknown"]
 HealthMetricValue = int | float | str | bool
 
 
-class HealthRequestSummary(BaseModel):
+class HealthRequestSummary(RegistryModel):
     """Request activity observed within the health window."""
 
     window_start: datetime = Field(description="Beginning of the aggregation window (UTC)")
@@ -271,7 +285,7 @@ class HealthRequestSummary(BaseModel):
     )
 
 
-class HealthComponentBrief(BaseModel):
+class HealthComponentBrief(RegistryModel):
     """Lightweight component-level status summary."""
 
     id: str = Field(description="Stable identifier for the component")
@@ -285,7 +299,7 @@ class HealthComponentBrief(BaseModel):
     )
 
 
-class HealthLogReference(BaseModel):
+class HealthLogReference(RegistryModel):
     """Link or descriptor for logs relevant to a health component."""
 
     label: str = Field(description="Human readable log descriptor")
@@ -298,7 +312,7 @@ class HealthLogReference(BaseModel):
     )
 
 
-class HealthSummaryResponse(BaseModel):
+class HealthSummaryResponse(RegistryModel):
     """High-level snapshot summarizing registry health and recent activity."""
 
     status: HealthStatus
@@ -323,7 +337,7 @@ class HealthSummaryResponse(BaseModel):
     )
 
 
-class HealthTimelineEntry(BaseModel):
+class HealthTimelineEntry(RegistryModel):
     """Time-series datapoint for a component metric."""
 
     bucket: datetime = Field(description="Start timestamp of the sampled bucket (UTC)")
@@ -331,7 +345,7 @@ class HealthTimelineEntry(BaseModel):
     unit: Optional[str] = Field(None, description="Unit associated with the metric value")
 
 
-class HealthIssue(BaseModel):
+class HealthIssue(RegistryModel):
     """Outstanding issue or alert impacting a component."""
 
     code: str = Field(description="Machine readable issue identifier")
@@ -342,7 +356,7 @@ class HealthIssue(BaseModel):
     )
 
 
-class HealthComponentDetail(BaseModel):
+class HealthComponentDetail(RegistryModel):
     """Detailed status, metrics, and log references for a component."""
 
     id: str = Field(description="Stable identifier for the component")
@@ -362,7 +376,7 @@ class HealthComponentDetail(BaseModel):
     logs: Optional[list[HealthLogReference]] = None
 
 
-class HealthComponentCollection(BaseModel):
+class HealthComponentCollection(RegistryModel):
     """Detailed health diagnostics broken down per component."""
 
     components: list[HealthComponentDetail]
@@ -1,14 +1,48 @@
 """Registry reset endpoint."""
 
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import APIRouter, HTTPException, status, Depends
 
 from ..dependencies import get_dynamodb_table
+from ..utils.dynamodb import clear_item_cache, parallel_scan
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/reset",
     tags=["admin"],
 )
 
+# DynamoDB accepts at most 25 write requests per BatchWriteItem call.
+_BATCH_WRITE_SIZE = 25
+# Upper bound on BatchWriteItem calls in flight during a reset.
+_RESET_DELETE_WORKERS = 32
+# Attempts per batch before giving up on items DynamoDB keeps returning as unprocessed.
+_MAX_BATCH_ATTEMPTS = 8
+
+_delete_executor = ThreadPoolExecutor(
+    max_workers=_RESET_DELETE_WORKERS, thread_name_prefix="registry-reset"
+)
+
+
+def _delete_batch(table, ids: list) -> None:
+    """Delete up to 25 ids with one BatchWriteItem, retrying unprocessed items with backoff."""
+    request_items = {table.name: [{"DeleteRequest": {"Key": {"id": i}}} for i in ids]}
+    for attempt in range(_MAX_BATCH_ATTEMPTS):
+        response = table.meta.client.batch_write_item(RequestItems=request_items)
+        request_items = response.get("UnprocessedItems") or {}
+        if not request_items:
+            return
+        time.sleep(min(0.05 * 2**attempt, 1.0))
+    raise RuntimeError(
+        f"{len(request_items.get(table.name, []))} deletes still unprocessed after "
+        f"{_MAX_BATCH_ATTEMPTS} attempts"
+    )
+
 
 @router.delete(
     "",
@@ -27,23 +61,27 @@ async def registry_reset(
     Reset the registry to a system default state.
     """
     try:
-        scan_kwargs: dict = {}
-        while True:
-            resp = table.scan(**scan_kwargs)
-            items = resp.get("Items", [])
-
-            if items:
-                with table.batch_writer() as batch:
-                    for item in items:
-                        batch.delete_item(Key={"id": item["id"]})
-
-            last_key = resp.get("LastEvaluatedKey")
-            if not last_key:
-                break
-            scan_kwargs["ExclusiveStartKey"] = last_key
-
-    except Exception as exc:  # noqa: BLE001
-        print(f"Error resetting registry: {exc}")
+        # Only the key is needed to delete an item.
+        items = await parallel_scan(table, ProjectionExpression="id")
+        ids = [item["id"] for item in items]
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    _delete_executor,
+                    _delete_batch,
+                    table,
+                    ids[start : start + _BATCH_WRITE_SIZE],  # noqa: E203
+                )
+                for start in range(0, len(ids), _BATCH_WRITE_SIZE)
+            )
+        )
+
+        clear_item_cache()
+
+    except Exception:  # noqa: BLE001
+        logger.exception("Error resetting registry")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to reset the registry.",
@@ -1,7 +1,14 @@
 """Artifact management endpoints."""
 
+import asyncio
+import hashlib
+import logging
+from functools import lru_cache
 from typing import Annotated
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
 from fastapi import APIRouter, HTTPException, status, Query, Header, Response, Depends
+from pydantic import HttpUrl, TypeAdapter
 
 from ..models import (
     Artifact,
@@ -14,18 +21,62 @@ from ..models import (
 )
 from ..dependencies import get_dynamodb_table
 from ..utils.dynamodb import (
+    get_item_cached,
+    invalidate_cached_item,
     query_artifacts_by_name,
     parse_pagination_token,
     encode_pagination_token,
     format_artifact_metadata,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/artifacts",
     tags=["artifacts"],
 )
 
 
+# Stored string for each artifact type, looked up once per query type instead of via .value.
+_TYPE_VALUES: dict[ArtifactType, str] = {t: t.value for t in ArtifactType}
+
+# Validates a whole page of list results in one call into pydantic-core.
+_METADATA_LIST_ADAPTER = TypeAdapter(list[ArtifactMetadata])
+
+
+# Reused for every stored URL; HttpUrl(...) goes through a cached adapter lookup per call.
+_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+
+@lru_cache(maxsize=4096)
+def _stored_url(url: str) -> HttpUrl:
+    """Parse a URL read back from storage, memoized since the same artifacts are read repeatedly."""
+    return _URL_ADAPTER.validate_python(url)
+
+
+def _artifact_etag(artifact_id: str, name: str, url: str, download_url: str) -> str:
+    """Strong ETag over every stored field that ends up in the Artifact response."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (artifact_id, name, url, download_url):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def _distinct_filters(queries: list[ArtifactQuery]) -> list[tuple[str, tuple[str, ...] | None]]:
+    """
+    Reduce the queries to the distinct (name, types) scans they need, in order.
+    An untyped "*" matches every item a page scans, so it makes the other queries redundant.
+    """
+    filters = dict.fromkeys(
+        (query.name, tuple(_TYPE_VALUES[t] for t in query.types) if query.types else None)
+        for query in queries
+    )
+    if ("*", None) in filters:
+        return [("*", None)]
+    return list(filters)
+
+
 @router.post(
     "",
     response_model=list[ArtifactMetadata],
@@ -37,13 +88,12 @@ router = APIRouter(
 )
 async def artifacts_list(
     queries: list[ArtifactQuery],
-    response: Response,
     x_authorization: Annotated[str | None, Header(alias="X-Authorization")] = None,
     offset: Annotated[
         EnumerateOffset | None, Query(description="Provide this for pagination")
     ] = None,
     table=Depends(get_dynamodb_table),
-) -> list[ArtifactMetadata]:
+) -> Response:
     """
     Get the artifacts from the registry. (BASELINE)
 
@@ -64,65 +114,72 @@ async def artifacts_list(
     PAGE_SIZE = 100
     MAX_RESULTS = 1000
 
-    all_artifacts: list[dict] = []
-    next_key = last_evaluated_key
+    for query in queries:
+        if not query.name:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Artifact name is required in query.",
+            )
 
     try:
-        # Process each query
-        for query in queries:
-            if not query.name:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Artifact name is required in query.",
+        # Fan the queries out concurrently so the page costs one round trip, not one per query.
+        # Every query scans from the same key with the same Limit, so they stop at the same key.
+        pages = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    query_artifacts_by_name,
+                    table=table,
+                    name=name,
+                    artifact_types=artifact_types,
+                    limit=PAGE_SIZE,
+                    last_evaluated_key=last_evaluated_key,
                 )
-
-            # Extract artifact types if provided
-            artifact_types = None
-            if query.types:
-                artifact_types = [t.value for t in query.types]
-
-            # Query DynamoDB
-            items, next_key = query_artifacts_by_name(
-                table=table,
-                name=query.name,
-                artifact_types=artifact_types,
-                limit=PAGE_SIZE,
-                last_evaluated_key=next_key,
+                for name, artifact_types in _distinct_filters(queries)
             )
+        )
 
-            # Add items to results
-            all_artifacts.extend(items)
-
-            # Check if we've hit the maximum result limit
-            if len(all_artifacts) >= MAX_RESULTS:
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail="Too many artifacts returned. Please refine your query or use pagination.",
-                )
-
-            # If we have a next key and haven't filled the page, continue
-            # Otherwise, break to return current results
-            if not next_key or len(all_artifacts) >= PAGE_SIZE:
-                break
+        # Merge in query order, dropping artifacts matched by more than one query
+        all_artifacts: list[dict] = []
+        seen_ids: set[str] = set()
+        next_key = None
+        for items, page_next_key in pages:
+            next_key = next_key or page_next_key
+            for item in items:
+                if item.get("id") in seen_ids:
+                    continue
+                seen_ids.add(item.get("id"))
+                all_artifacts.append(item)
+
+        # Check if we've hit the maximum result limit
+        if len(all_artifacts) >= MAX_RESULTS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Too many artifacts returned. Please refine your query or use pagination.",
+            )
 
-        # Format artifacts to match ArtifactMetadata schema
-        formatted_artifacts = [
-            ArtifactMetadata(**format_artifact_metadata(item)) for item in all_artifacts
-        ]
+        # Format artifacts to match ArtifactMetadata schema. The adapter validates and
+        # serializes the page in pydantic-core, so FastAPI's own response pass is skipped.
+        formatted_artifacts = _METADATA_LIST_ADAPTER.validate_python(
+            [format_artifact_metadata(item) for item in all_artifacts]
+        )
+        page = Response(
+            content=_METADATA_LIST_ADAPTER.dump_json(formatted_artifacts),
+            media_type="application/json",
+        )
         # Set pagination header if there are more results
         if next_key:
             next_offset = encode_pagination_token(next_key)
             if next_offset:
-                response.headers["offset"] = next_offset
+                page.headers["offset"] = next_offset
 
-        return formatted_artifacts
+        return page
 
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
-    except Exception as e:
+    except Exception:
         # Log the error and return 500
-        print(f"Error querying artifacts: {e}")
+        logger.exception("Error querying artifacts")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while querying artifacts.",
@@ -134,6 +191,7 @@ async def artifacts_list(
     response_model=Artifact,
     responses={
         200: {"description": "Return the artifact. url is required."},
+        304: {"description": "The artifact matches the ETag in If-None-Match."},
         400: {"description": "Missing or invalid artifact_type or artifact_id."},
         403: {
             "description": "Authentication failed due to invalid or missing AuthenticationToken."
@@ -145,7 +203,9 @@ async def artifacts_list(
 async def artifact_retrieve(
     artifact_type: ArtifactType,
     id: ArtifactID,
+    response: Response,
     x_authorization: Annotated[str | None, Header(alias="X-Authorization")] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
     table=Depends(get_dynamodb_table),
 ) -> Artifact:
     """
@@ -155,15 +215,14 @@ async def artifact_retrieve(
 
     # Look up item in DynamoDB
     try:
-        response = table.get_item(Key={"id": id})
-    except Exception as e:  # noqa: BLE001
-        print(f"Error retrieving artifact from DynamoDB: {e}")
+        item = await get_item_cached(table, id)
+    except Exception:  # noqa: BLE001
+        logger.exception("Error retrieving artifact %s from DynamoDB", id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="The artifact storage encountered an error.",
         )
 
-    item = response.get("Item")
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -198,12 +257,19 @@ async def artifact_retrieve(
             detail="Artifact is missing url in storage.",
         )
 
-    data = ArtifactData(
-        url=url,
-        download_url=data.get("download_url")
-        or md.get("download_url")
-        or item.get("download_url")
-        or url,
+    download_url = (
+        data.get("download_url") or md.get("download_url") or item.get("download_url") or url
+    )
+
+    # Clients that already hold this exact artifact get a bodiless 304.
+    etag = _artifact_etag(metadata.id, metadata.name, url, download_url)
+    if if_none_match and (if_none_match.strip() == "*" or etag in if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # URLs were validated on ingest, so skip re-validating the envelope.
+    data = ArtifactData.model_construct(
+        url=_stored_url(url), download_url=_stored_url(download_url)
     )
 
     return Artifact(metadata=metadata, data=data)
@@ -253,38 +319,42 @@ async def artifact_delete(
 
     Delete only the artifact that matches "id". (id is a unique identifier for an artifact)
     """
-    # First check if artifact exists and type matches
+    # Existence and type are checked by DynamoDB in the same round trip as the delete.
+    # The stored type may live at the top level or (older items) only under metadata.
+    type_matches = Attr("type").eq(artifact_type.value) | (
+        Attr("type").not_exists() & Attr("metadata.type").eq(artifact_type.value)
+    )
     try:
-        response = table.get_item(Key={"id": id})
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="The artifact storage encountered an error.",
+        await asyncio.to_thread(
+            table.delete_item,
+            Key={"id": id},
+            ConditionExpression=Attr("id").exists() & type_matches,
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
-
-    item = response.get("Item")
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Artifact does not exist.",
-        )
-
-    md = item.get("metadata") or {}
-    # Check type matches
-    stored_type = item.get("type") or md.get("type")
-    if stored_type != artifact_type.value:
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+            logger.exception("Error deleting artifact %s from DynamoDB", id)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="The artifact storage encountered an error while deleting.",
+            )
+        # The old item is only returned when it exists, i.e. the type did not match.
+        if not exc.response.get("Item"):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Artifact does not exist.",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="artifact_type does not match stored artifact type.",
         )
-
-    # Delete the artifact
-    try:
-        table.delete_item(Key={"id": id})
-    except Exception:
+    except Exception:  # noqa: BLE001
+        logger.exception("Error deleting artifact %s from DynamoDB", id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="The artifact storage encountered an error while deleting.",
         )
+    finally:
+        invalidate_cached_item(id)
 
     return {"message": "Artifact deleted successfully"}
@@ -1,12 +1,14 @@
 """Artifact by name endpoints."""
 
+from operator import attrgetter
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from botocore.exceptions import ClientError
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from ..dependencies import get_dynamodb_table
+from ..utils.dynamodb import query_artifacts_by_exact_name
 
 router = APIRouter(prefix="/artifact", tags=["search"])
 
@@ -17,6 +19,9 @@ class ArtifactMetadata(BaseModel):
     type: str
 
 
+_METADATA_LIST_ADAPTER = TypeAdapter(list[ArtifactMetadata])
+
+
 @router.get(
     "/byName/{name}",
     response_model=list[ArtifactMetadata],
@@ -35,7 +40,7 @@ async def artifact_by_name_get(
     name: str,
     x_authorization: Optional[str] = Header(default=None, alias="X-Authorization"),
     table=Depends(get_dynamodb_table),
-) -> list[ArtifactMetadata]:
+) -> Response:
     """
     List artifact metadata for this name. (NON-BASELINE)
     Return metadata for each artifact matching this name.
@@ -48,32 +53,23 @@ async def artifact_by_name_get(
         )
 
     results = []
-    scan_kwargs = {}
 
     try:
-        while True:
-            resp = table.scan(**scan_kwargs)
-            items = resp.get("Items", [])
-
-            for item in items:
-                md = item.get("metadata") or {}
-
-                artifact_name = md.get("name") or item.get("name")
-                art_id = md.get("id") or item.get("id")
-                art_type = md.get("type") or item.get("type")
+        items = await query_artifacts_by_exact_name(table, name)
+        for item in items:
+            md = item.get("metadata") or {}
 
-                if not isinstance(artifact_name, str) or art_id is None or art_type is None:
-                    continue
+            artifact_name = md.get("name") or item.get("name")
+            art_id = md.get("id") or item.get("id")
+            art_type = md.get("type") or item.get("type")
 
-                if artifact_name == name:
-                    results.append(
-                        ArtifactMetadata(name=artifact_name, id=str(art_id), type=str(art_type))
-                    )
+            if not isinstance(artifact_name, str) or art_id is None or art_type is None:
+                continue
 
-            last_key = resp.get("LastEvaluatedKey")
-            if not last_key:
-                break
-            scan_kwargs["ExclusiveStartKey"] = last_key
+            if artifact_name == name:
+                results.append(
+                    ArtifactMetadata(name=artifact_name, id=str(art_id), type=str(art_type))
+                )
 
     except ClientError:
         raise HTTPException(
@@ -87,4 +83,8 @@ async def artifact_by_name_get(
             detail="No such artifact.",
         )
 
-    return sorted(results, key=lambda x: x.id)
+    # Serialize with the prebuilt adapter; response_model above only documents the shape.
+    return Response(
+        content=_METADATA_LIST_ADAPTER.dump_json(sorted(results, key=attrgetter("id"))),
+        media_type="application/json",
+    )
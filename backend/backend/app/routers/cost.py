@@ -1,6 +1,5 @@
 """Artifact cost calculation endpoints."""
 
-import hashlib
 from typing import Annotated
 from fastapi import APIRouter, HTTPException, status, Query, Header, Depends
 
@@ -11,6 +10,8 @@ from ..models import (
     ArtifactID,
 )
 from ..dependencies import get_dynamodb_table
+from ..utils.cost import standalone_cost
+from ..utils.dynamodb import get_item_cached
 
 router = APIRouter(
     prefix="/artifact",
@@ -46,14 +47,13 @@ async def artifact_cost(
     Return the total cost of the artifact, and its dependencies
     """
     try:
-        response = table.get_item(Key={"id": id})
+        item = await get_item_cached(table, id)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="The artifact storage encountered an error.",
         )
 
-    item = response.get("Item")
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -67,9 +67,8 @@ async def artifact_cost(
             detail="artifact_type does not match stored artifact type.",
         )
 
-    hash_obj = hashlib.md5(id.encode())
-    hash_int = int(hash_obj.hexdigest()[:8], 16)
-    base_cost = (hash_int % 900) + 100
+    stored_cost = item.get("standalone_cost")
+    base_cost = int(stored_cost) if stored_cost is not None else standalone_cost(id)
 
     if dependency:
         cost_detail = ArtifactCostDetail(
@@ -1,9 +1,15 @@
 """Artifact creation (ingestion) endpoints."""
 
+import asyncio
+import binascii
+import logging
+import os
+import threading
+from functools import lru_cache
 from typing import Annotated, Optional
-from uuid import uuid4
 from urllib.parse import urlparse
 
+from botocore.exceptions import ClientError
 from fastapi import APIRouter, HTTPException, status, Header, Depends
 
 from ..models import (
@@ -14,27 +20,51 @@ from ..models import (
     ArtifactID,
 )
 from ..dependencies import get_dynamodb_table
+from ..utils.cost import standalone_cost
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/artifact",
     tags=["artifact-ingest"],
 )
 
-_RESERVED_TAIL_SEGMENTS = {
-    "",
-    "tree",
-    "blob",
-    "resolve",
-    "raw",
-    "download",
-    "files",
-    "main",
-    "master",
-    "dev",
-    "trunk",
-}
+_RESERVED_TAIL_SEGMENTS = frozenset(
+    {
+        "",
+        "tree",
+        "blob",
+        "resolve",
+        "raw",
+        "download",
+        "files",
+        "main",
+        "master",
+        "dev",
+        "trunk",
+    }
+)
+
+# Artifact ids are drawn from a per-thread buffer of random bytes so that a
+# single os.urandom() call covers a few hundred ids.
+_ID_BYTES = 16
+_ID_POOL_SIZE = 4096
+_id_pool = threading.local()
 
 
+def _new_artifact_id() -> str:
+    """Return a random 32-character hex artifact id (128 bits, like uuid4().hex)."""
+    buf = getattr(_id_pool, "buf", b"")
+    pos = getattr(_id_pool, "pos", 0)
+    if pos + _ID_BYTES > len(buf):
+        buf = os.urandom(_ID_POOL_SIZE)
+        pos = 0
+        _id_pool.buf = buf
+    _id_pool.pos = pos + _ID_BYTES
+    return binascii.hexlify(buf[pos : pos + _ID_BYTES]).decode("ascii")  # noqa: E203
+
+
+@lru_cache(maxsize=4096)
 def _name_from_url(url: str) -> str:
     """
     Extract a stable artifact name from common artifact URLs.
@@ -45,13 +75,16 @@ def _name_from_url(url: str) -> str:
       GH: https://github.com/openai/whisper -> whisper
       GH: https://github.com/openai/whisper/tree/main -> whisper
     """
-    parsed = urlparse(url)
-    parts = [p for p in parsed.path.split("/") if p]
+    # Split scheme/host/path by hand; urlparse does far more work than this needs.
+    url = url.split("#", 1)[0].split("?", 1)[0]
+    _, sep, rest = url.partition("://")
+    host, _, path = (rest if sep else url).partition("/")
+    parts = [p for p in path.split("/") if p]
 
     if not parts:
         return "artifact"
 
-    host = (parsed.netloc or "").lower()
+    host = host.lower()
 
     # Hugging Face: /{owner}/{repo}/...
     if "huggingface.co" in host:
@@ -117,7 +150,8 @@ async def artifact_create(
     Baseline does not require auth; X-Authorization is ignored if present.
     """
 
-    parsed = urlparse(str(artifact_data.url))
+    url = str(artifact_data.url)
+    parsed = urlparse(url)
     if not parsed.scheme or not parsed.netloc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -127,29 +161,37 @@ async def artifact_create(
             ),
         )
 
-    name = _name_from_url(str(artifact_data.url))
-    artifact_id: ArtifactID = uuid4().hex
+    name = _name_from_url(url)
+    artifact_id: ArtifactID = _new_artifact_id()
 
+    # Every field is stored once, at the top level; readers derive metadata/data from it.
     item = {
         "id": artifact_id,
         "name": name,
         "type": artifact_type.value,
-        "url": str(artifact_data.url),
-        "metadata": {
-            "id": artifact_id,
-            "name": name,
-            "type": artifact_type.value,
-        },
-        "data": {
-            "url": str(artifact_data.url),
-            "download_url": str(artifact_data.download_url or artifact_data.url),
-        },
+        "url": url,
+        "download_url": str(artifact_data.download_url) if artifact_data.download_url else url,
+        "standalone_cost": standalone_cost(artifact_id),
     }
 
     try:
-        table.put_item(Item=item)
-    except Exception as exc:  # noqa: BLE001
-        print(f"Error writing artifact to DynamoDB: {exc}")
+        # Refuse to overwrite: the existence check rides on the write itself.
+        await asyncio.to_thread(
+            table.put_item, Item=item, ConditionExpression="attribute_not_exists(id)"
+        )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Artifact exists already.",
+            )
+        logger.exception("Error writing artifact %s to DynamoDB", artifact_id)
+        raise HTTPException(
+            status_code=status.HTTP_424_FAILED_DEPENDENCY,
+            detail="Artifact is not registered due to an internal storage error.",
+        )
+    except Exception:  # noqa: BLE001
+        logger.exception("Error writing artifact %s to DynamoDB", artifact_id)
         raise HTTPException(
             status_code=status.HTTP_424_FAILED_DEPENDENCY,
             detail="Artifact is not registered due to an internal storage error.",
@@ -160,7 +202,8 @@ async def artifact_create(
         name=name,
         type=artifact_type,
     )
-    data = ArtifactData(
+    # Both URLs were validated with the request body; don't parse them a second time.
+    data = ArtifactData.model_construct(
         url=artifact_data.url,
         download_url=artifact_data.download_url or artifact_data.url,
     )
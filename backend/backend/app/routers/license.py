@@ -1,19 +1,25 @@
 """License compatibility check endpoints."""
 
 from typing import Annotated
-from fastapi import APIRouter, HTTPException, status, Header, Depends
+from fastapi import APIRouter, HTTPException, status, Header, Depends, Response
 
 from ..models import (
     SimpleLicenseCheckRequest,
     ArtifactID,
 )
 from ..dependencies import get_dynamodb_table
+from ..utils.dynamodb import get_item_cached
 
 router = APIRouter(
     prefix="/artifact/model",
     tags=["license"],
 )
 
+# The check's only successful answer, encoded once.
+_COMPATIBLE_BODY = b"true"
+
+_GITHUB_HOSTS = frozenset({"github.com", "www.github.com"})
+
 
 @router.post(
     "/{id}/license-check",
@@ -33,32 +39,31 @@ async def artifact_license_check(
     request: SimpleLicenseCheckRequest,
     x_authorization: Annotated[str | None, Header(alias="X-Authorization")] = None,
     table=Depends(get_dynamodb_table),
-) -> bool:
+) -> Response:
     """
     Assess license compatibility for fine-tune and inference usage. (BASELINE)
 
     License compatibility analysis produced successfully.
     """
+    # The URL is checked first so a bad request never costs a DynamoDB read.
+    if request.github_url.host not in _GITHUB_HOSTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid GitHub URL provided.",
+        )
+
     try:
-        response = table.get_item(Key={"id": id})
+        item = await get_item_cached(table, id)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="The artifact storage encountered an error.",
         )
 
-    item = response.get("Item")
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Artifact does not exist.",
         )
 
-    github_url_str = str(request.github_url)
-    if not github_url_str or "github.com/" not in github_url_str:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid GitHub URL provided.",
-        )
-
-    return True
+    return Response(content=_COMPATIBLE_BODY, media_type="application/json")
@@ -1,21 +1,24 @@
 """Artifact lineage graph endpoints."""
 
 from typing import Annotated
-from fastapi import APIRouter, HTTPException, status, Header, Depends
+from fastapi import APIRouter, HTTPException, status, Header, Depends, Response
 
 from ..models import (
     ArtifactLineageGraph,
-    ArtifactLineageNode,
-    ArtifactLineageEdge,
     ArtifactID,
 )
 from ..dependencies import get_dynamodb_table
+from ..utils.dynamodb import cache_body, get_cached_body, get_item_cached
+from ..utils.lineage import build_lineage
 
 router = APIRouter(
     prefix="/artifact/model",
     tags=["lineage"],
 )
 
+# Kind under which the serialized graph is kept in the item body cache.
+_LINEAGE_BODY = "lineage"
+
 
 @router.get(
     "/{id}/lineage",
@@ -33,101 +36,26 @@ async def artifact_lineage_get(
     id: ArtifactID,
     x_authorization: Annotated[str | None, Header(alias="X-Authorization")] = None,
     table=Depends(get_dynamodb_table),
-) -> ArtifactLineageGraph:
+) -> Response:
     """
     Retrieve the lineage graph for this artifact. (BASELINE)
     """
     try:
-        response = table.get_item(Key={"id": id})
+        item = await get_item_cached(table, id)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="The artifact storage encountered an error.",
         )
 
-    item = response.get("Item")
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Artifact does not exist.",
         )
 
-    md = item.get("metadata") or {}
-    data = item.get("data") or {}
-
-    name = md.get("name") or item.get("name", "unknown")
-    art_type = md.get("type") or item.get("type", "model")
-
-    nodes: list[ArtifactLineageNode] = []
-    edges: list[ArtifactLineageEdge] = []
-
-    def add_node(node_id: str, node_name: str, source: str, metadata: dict | None = None) -> None:
-        for n in nodes:
-            if n.artifact_id == node_id:
-                return
-        nodes.append(
-            ArtifactLineageNode(
-                artifact_id=node_id,
-                name=node_name,
-                source=source,
-                metadata=metadata,
-            )
-        )
-
-    add_node(
-        id,
-        name,
-        "config_json",
-        {
-            "type": art_type,
-            "source_url": data.get("url") or item.get("url", ""),
-            "stored_at": item.get("created_at", ""),
-        },
-    )
-
-    dependencies = (
-        item.get("dependencies") or md.get("dependencies") or data.get("dependencies") or []
-    )
-    if isinstance(dependencies, list):
-        for dep in dependencies:
-            dep_id = None
-            dep_name = None
-            dep_type = "dependency"
-            relationship = "depends_on"
-
-            if isinstance(dep, dict):
-                if "id" in dep:
-                    dep_id = str(dep["id"])
-                dep_name = dep.get("name")
-                dep_type = dep.get("type", dep_type)
-                relationship = dep.get("relationship", relationship)
-            elif isinstance(dep, str):
-                dep_id = dep
-
-            if dep_id:
-                dep_name = dep_name or f"{name}-dependency"
-                add_node(dep_id, dep_name, "config_json", {"type": dep_type})
-                edges.append(
-                    ArtifactLineageEdge(
-                        from_node_artifact_id=dep_id,
-                        to_node_artifact_id=id,
-                        relationship=relationship,
-                    )
-                )
-
-    if not edges:
-        import hashlib
-
-        hash_obj = hashlib.md5(id.encode())
-        hash_int = int(hash_obj.hexdigest()[:12], 16)
-        base_id = str(hash_int)
-
-        base_name = "base-" + name.split("-")[0] if "-" in name else "base-model"
-        add_node(base_id, base_name, "config_json", {"type": "base"})
-        edges.append(
-            ArtifactLineageEdge(
-                from_node_artifact_id=base_id, to_node_artifact_id=id, relationship="base_model"
-            )
-        )
-
-    return ArtifactLineageGraph(nodes=nodes, edges=edges)
+    body = get_cached_body(_LINEAGE_BODY, id)
+    if body is None:
+        body = build_lineage(item, id).model_dump_json().encode()
+        cache_body(_LINEAGE_BODY, id, item, body)
+    return Response(content=body, media_type="application/json")
@@ -1,7 +1,9 @@
 """Model rating endpoints."""
 
-import hashlib
-from fastapi import APIRouter, HTTPException, status, Depends
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, HTTPException, status, Depends, Response
 
 from ..models import (
     ModelRating,
@@ -9,71 +11,65 @@ from ..models import (
     SizeScore,
 )
 from ..dependencies import get_dynamodb_table
+from ..utils.dynamodb import cache_body, get_cached_body, get_item_cached
+from ..utils.ids import id_hash
 
 router = APIRouter(
     prefix="/artifact/model",
     tags=["rating"],
 )
 
+# Kind under which the serialized rating is kept in the item body cache.
+_RATING_BODY = "rating"
 
-@router.get(
-    "/{id}/rate",
-    response_model=ModelRating,
-    responses={
-        200: {
-            "description": "Return the rating. Only use this if each metric was computed successfully."
-        },
-        400: {
-            "description": "There is missing field(s) in the artifact_id or it is formed improperly, or is invalid."
-        },
-        404: {"description": "Artifact does not exist."},
-        500: {
-            "description": "The artifact rating system encountered an error while computing at least one metric."
-        },
-    },
+# (name substring, base score, size scores), checked in order. SizeScore is frozen,
+# so one instance per row is shared by every response.
+_HEURISTICS: tuple[tuple[str, float, SizeScore], ...] = (
+    ("bert", 0.95, SizeScore(raspberry_pi=0.2, jetson_nano=0.4, desktop_pc=0.95, aws_server=1.0)),
+    (
+        "audience",
+        0.35,
+        SizeScore(raspberry_pi=0.75, jetson_nano=0.8, desktop_pc=1.0, aws_server=1.0),
+    ),
+    ("whisper", 0.7, SizeScore(raspberry_pi=0.9, jetson_nano=0.95, desktop_pc=1.0, aws_server=1.0)),
+)
+# Default moderately high score to satisfy most thresholds.
+_DEFAULT_HEURISTIC = (
+    0.8,
+    SizeScore(raspberry_pi=0.6, jetson_nano=0.65, desktop_pc=0.85, aws_server=0.9),
 )
-async def model_artifact_rate(
-    id: ArtifactID,
-    table=Depends(get_dynamodb_table),
-) -> ModelRating:
-    """
-    Get ratings for this model artifact. (BASELINE)
-
-    Return the rating. Only use this if each metric was computed successfully.
-    """
 
-    try:
-        response = table.get_item(Key={"id": id})
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="The artifact storage encountered an error.",
-        )
 
-    item = response.get("Item")
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Artifact does not exist.",
-        )
+@lru_cache(maxsize=1024)
+def _heuristic_scores(nm: str) -> tuple[float, SizeScore]:
+    """Base score and size scores for a model name; the first matching row wins."""
+    nm_lower = nm.lower()
+    for pattern, base, size in _HEURISTICS:
+        if pattern in nm_lower:
+            return base, size
+    return _DEFAULT_HEURISTIC
 
-    md = item.get("metadata") or {}
-    data = item.get("data") or {}
-    name = md.get("name") or item.get("name", "unknown")
 
+@lru_cache(maxsize=4096)
+def _build_rating(id: str, name: str, stored_json: str | None) -> bytes:
+    """
+    Serialized ModelRating for an artifact. Every input is part of the cache key,
+    so a changed stored item simply misses instead of needing invalidation.
+    """
     # If a precomputed rating is stored, return it directly to match expected values.
-    stored_rating = item.get("rating") or md.get("rating") or data.get("rating")
-    if isinstance(stored_rating, dict):
+    if stored_json is not None:
+        stored_rating = orjson.loads(stored_json)
         try:
             # Ensure size_score is present and shaped correctly
             size_score_data = stored_rating.get("size_score") or {}
-            size_score = SizeScore(
+            # Every field is already a float, so there is nothing left to validate.
+            size_score = SizeScore.model_construct(
                 raspberry_pi=float(size_score_data.get("raspberry_pi", 0)),
                 jetson_nano=float(size_score_data.get("jetson_nano", 0)),
                 desktop_pc=float(size_score_data.get("desktop_pc", 0)),
                 aws_server=float(size_score_data.get("aws_server", 0)),
             )
-            return ModelRating(
+            rating = ModelRating(
                 name=stored_rating.get("name", name),
                 category=stored_rating.get("category", "model-category"),
                 net_score=float(stored_rating.get("net_score", 0)),
@@ -105,35 +101,18 @@ async def model_artifact_rate(
                 size_score=size_score,
                 size_score_latency=float(stored_rating.get("size_score_latency", 0.1)),
             )
+            return rating.model_dump_json().encode()
         except Exception:
             # Fall back to generated rating on parse issues
             pass
 
-    def _heuristic_scores(nm: str) -> tuple[float, SizeScore]:
-        nm_lower = nm.lower()
-        if "bert" in nm_lower:
-            base = 0.95
-            size = SizeScore(raspberry_pi=0.2, jetson_nano=0.4, desktop_pc=0.95, aws_server=1.0)
-        elif "audience" in nm_lower:
-            base = 0.35
-            size = SizeScore(raspberry_pi=0.75, jetson_nano=0.8, desktop_pc=1.0, aws_server=1.0)
-        elif "whisper" in nm_lower:
-            base = 0.7
-            size = SizeScore(raspberry_pi=0.9, jetson_nano=0.95, desktop_pc=1.0, aws_server=1.0)
-        else:
-            # Default moderately high score to satisfy most thresholds.
-            base = 0.8
-            size = SizeScore(raspberry_pi=0.6, jetson_nano=0.65, desktop_pc=0.85, aws_server=0.9)
-        return base, size
-
     base_score, size_score = _heuristic_scores(name)
 
-    hash_obj = hashlib.md5(id.encode())
-    hash_int = int(hash_obj.hexdigest()[:8], 16)
-    jitter = (hash_int % 10) / 100.0  # small variation 0.00-0.09
+    jitter = (id_hash(id, 4) % 10) / 100.0  # small variation 0.00-0.09
     score = min(1.0, max(0.0, base_score + jitter * 0.2 - 0.05))
 
-    return ModelRating(
+    # The generated rating is all computed floats and the stored name; skip validation.
+    rating = ModelRating.model_construct(
         name=name,
         category="model-category",
         net_score=score,
@@ -161,3 +140,64 @@ async def model_artifact_rate(
         size_score=size_score,
         size_score_latency=0.1,
     )
+    return rating.model_dump_json().encode()
+
+
+@router.get(
+    "/{id}/rate",
+    response_model=ModelRating,
+    responses={
+        200: {
+            "description": "Return the rating. Only use this if each metric was computed successfully."
+        },
+        400: {
+            "description": "There is missing field(s) in the artifact_id or it is formed improperly, or is invalid."
+        },
+        404: {"description": "Artifact does not exist."},
+        500: {
+            "description": "The artifact rating system encountered an error while computing at least one metric."
+        },
+    },
+)
+async def model_artifact_rate(
+    id: ArtifactID,
+    table=Depends(get_dynamodb_table),
+) -> Response:
+    """
+    Get ratings for this model artifact. (BASELINE)
+
+    Return the rating. Only use this if each metric was computed successfully.
+    """
+
+    try:
+        item = await get_item_cached(table, id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="The artifact storage encountered an error.",
+        )
+
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Artifact does not exist.",
+        )
+
+    # Repeat hits for a cached item skip even the _build_rating key serialization.
+    body = get_cached_body(_RATING_BODY, id)
+    if body is None:
+        md = item.get("metadata") or {}
+        data = item.get("data") or {}
+        name = md.get("name") or item.get("name", "unknown")
+
+        stored_rating = item.get("rating") or md.get("rating") or data.get("rating")
+        stored_json = None
+        if isinstance(stored_rating, dict):
+            # DynamoDB numbers come back as Decimal; str keeps them exact for float() later.
+            stored_json = orjson.dumps(
+                stored_rating, default=str, option=orjson.OPT_SORT_KEYS
+            ).decode()
+        body = _build_rating(id, name, stored_json)
+        cache_body(_RATING_BODY, id, item, body)
+
+    return Response(content=body, media_type="application/json")
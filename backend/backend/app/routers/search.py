@@ -2,15 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 import re
+import select
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
 from urllib.request import Request, urlopen
 
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 from pydantic import BaseModel
 
 from ..dependencies import get_dynamodb_table
+from ..utils.dynamodb import parallel_scan
+
+try:  # CPython's private regex parser; without it the literal prefilter is skipped
+    import re._constants as sre_constants
+    import re._parser as sre_parse
+except ImportError:  # pragma: no cover
+    sre_constants = sre_parse = None
+
+try:  # linear-time engine; without it every pattern goes to the backtracking worker
+    import re2
+except ImportError:  # pragma: no cover
+    re2 = None
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/artifact", tags=["search"])
 
@@ -21,9 +48,51 @@ class ArtifactMetadata(BaseModel):
     type: str
 
 
-_README_CACHE: dict[str, str] = {}
+# Fetched README text by artifact URL, bounded by total characters and refreshed hourly.
+# Failed fetches are kept too (as ''), so a dead repo isn't retried on every search.
+README_CACHE_MAX_CHARS = 32_000_000
+README_CACHE_TTL_SECONDS = 3600
+_README_CACHE: TTLCache = TTLCache(
+    maxsize=README_CACHE_MAX_CHARS,
+    ttl=README_CACHE_TTL_SECONDS,
+    getsizeof=lambda text: len(text) + 1,
+)
+# Fetches run on worker threads and cachetools caches are not thread-safe.
+_README_CACHE_LOCK = threading.Lock()
 _MAX_NETWORK_README_FETCHES = 10
 
+# README fetches run on worker threads; each candidate is a short blocking GET.
+_README_FETCH_WORKERS = 32
+_README_CANDIDATES_IN_FLIGHT = 2
+_readme_executor = ThreadPoolExecutor(
+    max_workers=_README_FETCH_WORKERS, thread_name_prefix="readme-fetch"
+)
+
+# Top-level attributes the search reads; metadata and data are small maps kept whole.
+_SEARCH_ATTRIBUTES = (
+    "id",
+    "name",
+    "type",
+    "url",
+    "metadata",
+    "data",
+    "readme",
+    "README",
+    "Readme",
+    "readme_text",
+    "readmeContent",
+    "readme_content",
+    "readmeMarkdown",
+    "readme_md",
+    "readmeBody",
+    "description",
+)
+# Placeholders for every attribute, since several (name, type, data, ...) are reserved words.
+_SEARCH_SCAN_KWARGS = {
+    "ProjectionExpression": ", ".join(f"#a{i}" for i in range(len(_SEARCH_ATTRIBUTES))),
+    "ExpressionAttributeNames": {f"#a{i}": attr for i, attr in enumerate(_SEARCH_ATTRIBUTES)},
+}
+
 
 _REGEX_META = set(r".^$*+?{}[]\|()")
 
@@ -39,6 +108,27 @@ def _fetch_text(url: str, timeout: float = 0.75, max_bytes: int = 250_000) -> st
         return ""
 
 
+def _first_text(urls: list[str]) -> str:
+    """
+    Return the first non-empty body among the candidates, in list order. Only the next
+    _README_CANDIDATES_IN_FLIGHT candidates are requested at a time, so a repo whose
+    README is on main or master costs one round trip without sending every other
+    candidate to the host as well.
+    """
+    remaining = iter(urls)
+    in_flight: deque[Future] = deque()
+    while True:
+        for url in islice(remaining, _README_CANDIDATES_IN_FLIGHT - len(in_flight)):
+            in_flight.append(_readme_executor.submit(_fetch_text, url))
+        if not in_flight:
+            return ""
+        text = in_flight.popleft().result()
+        if text:
+            for future in in_flight:
+                future.cancel()
+            return text
+
+
 def _github_owner_repo(url: str) -> Optional[tuple[str, str]]:
     if not isinstance(url, str) or "github.com/" not in url:
         return None
@@ -69,60 +159,53 @@ def _hf_owner_repo(url: str) -> Optional[tuple[str, str]]:
         return None
 
 
+# README-like fields in lookup order, as (source, key): 0 is the item itself, 1 its
+# metadata map and 2 its data map. The first non-blank string wins.
+_NESTED_README_KEYS = (
+    "readme",
+    "README",
+    "readme_text",
+    "readmeContent",
+    "readme_content",
+    "readmeMarkdown",
+    "readme_md",
+    "readmeBody",
+)
+_README_FIELDS: tuple[tuple[int, str], ...] = (
+    *((0, key) for key in ("readme", "README", "Readme", *_NESTED_README_KEYS[2:])),
+    *((1, key) for key in _NESTED_README_KEYS),
+    *((2, key) for key in _NESTED_README_KEYS),
+    (2, "description"),
+    (1, "description"),
+    (0, "description"),
+)
+
+
 def _extract_readme_text(item: dict) -> str:
     """
     Best-effort: pull README-like text from common DB fields.
     Autograder may store README text locally under varied keys.
     """
-    md = item.get("metadata") or {}
-    data = item.get("data") or {}
-
-    candidates = [
-        # top-level
-        item.get("readme"),
-        item.get("README"),
-        item.get("Readme"),
-        item.get("readme_text"),
-        item.get("readmeContent"),
-        item.get("readme_content"),
-        item.get("readmeMarkdown"),
-        item.get("readme_md"),
-        item.get("readmeBody"),
-        # nested metadata
-        md.get("readme"),
-        md.get("README"),
-        md.get("readme_text"),
-        md.get("readmeContent"),
-        md.get("readme_content"),
-        md.get("readmeMarkdown"),
-        md.get("readme_md"),
-        md.get("readmeBody"),
-        # nested data
-        data.get("readme"),
-        data.get("README"),
-        data.get("readme_text"),
-        data.get("readmeContent"),
-        data.get("readme_content"),
-        data.get("readmeMarkdown"),
-        data.get("readme_md"),
-        data.get("readmeBody"),
-        data.get("description"),
-        md.get("description"),
-        item.get("description"),
-    ]
-
-    for c in candidates:
-        if isinstance(c, str) and c.strip():
-            return c
+    sources = (item, item.get("metadata") or {}, item.get("data") or {})
+    for source, key in _README_FIELDS:
+        value = sources[source].get(key)
+        if isinstance(value, str) and value.strip():
+            return value
     return ""
 
 
+def _cached_readme(url: str) -> Optional[str]:
+    with _README_CACHE_LOCK:
+        return _README_CACHE.get(url)
+
+
 def _readme_for_url(url: str) -> str:
     """Fetch README from GH/HF raw endpoints. Cached. Never raises."""
     if not url:
         return ""
-    if url in _README_CACHE:
-        return _README_CACHE[url]
+    cached = _cached_readme(url)
+    if cached is not None:
+        return cached
 
     text = ""
 
@@ -139,10 +222,7 @@ def _readme_for_url(url: str) -> str:
             f"https://raw.githubusercontent.com/{owner}/{repo}/main/README.rst",
             f"https://raw.githubusercontent.com/{owner}/{repo}/master/README.rst",
         ]
-        for c in candidates:
-            text = _fetch_text(c)
-            if text:
-                break
+        text = _first_text(candidates)
 
     if not text:
         hf = _hf_owner_repo(url)
@@ -155,18 +235,20 @@ def _readme_for_url(url: str) -> str:
                 f"{base}/raw/main/README.MD",
                 f"{base}/raw/master/README.MD",
             ]
-            for c in candidates:
-                text = _fetch_text(c)
-                if text:
-                    break
+            text = _first_text(candidates)
 
-    _README_CACHE[url] = text or ""
-    return _README_CACHE[url]
+    text = text or ""
+    with _README_CACHE_LOCK:
+        _README_CACHE[url] = text
+    return text
 
 
+@lru_cache(maxsize=1024)
 def _compile_regex(pattern: str) -> tuple[re.Pattern, str, bool, str]:
     """
     Returns (compiled_regex, normalized_pattern, is_js_style, original_pattern_for_literal).
+    Memoized per raw pattern, so repeated searches skip parsing and compiling; invalid
+    patterns raise and are not cached.
     Supports:
       - Python regex: '^foo$'
       - JS-style: '/^foo$/i' or '/^foo$/' (flags optional; supported: i, m, s)
@@ -206,15 +288,221 @@ def _compile_regex(pattern: str) -> tuple[re.Pattern, str, bool, str]:
         )
 
 
+class _SearchBudgetExceeded(Exception):
+    """Matching a pattern did not finish within the time the search allows it."""
+
+
+# Patterns RE2 cannot take run under re in a long-lived child process, so a runaway
+# search can be interrupted. re checks for signals while it matches, so SIGALRM stops
+# a batch at its deadline; the child then reports a timeout and waits for the next one.
+_BACKTRACKING_WORKER_SCRIPT = """
+import json, re, signal, sys
+
+class Timeout(Exception):
+    pass
+
+def on_alarm(*_):
+    raise Timeout
+
+signal.signal(signal.SIGALRM, on_alarm)
+for line in sys.stdin:
+    request = json.loads(line)
+    try:
+        rx = re.compile(request["pattern"], request["flags"])
+        signal.setitimer(signal.ITIMER_REAL, request["seconds"])
+        try:
+            hits = [i for i, text in enumerate(request["texts"]) if rx.search(text)]
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        reply = {"hits": hits}
+    except Timeout:
+        reply = {"timeout": True}
+    sys.stdout.write(json.dumps(reply) + "\\n")
+    sys.stdout.flush()
+"""
+# Extra wait for the child's reply past the deadline before it is assumed stuck and killed.
+_BACKTRACKING_WORKER_GRACE_SECONDS = 0.2
+
+
+class _BacktrackingSearchWorker:
+    """
+    The child process running re searches, started on first use and kept for later
+    requests. One batch runs at a time; a child that misses its deadline is replaced.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [sys.executable, "-I", "-c", _BACKTRACKING_WORKER_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._proc
+
+    def _stop(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def search(self, rx: re.Pattern, texts: list[str], deadline: float) -> set[int]:
+        if not self._lock.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            raise _SearchBudgetExceeded
+        try:
+            proc = self._process()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise _SearchBudgetExceeded
+            request = {
+                "pattern": rx.pattern,
+                "flags": rx.flags,
+                "texts": texts,
+                "seconds": remaining,
+            }
+            try:
+                proc.stdin.write(json.dumps(request).encode() + b"\n")
+                proc.stdin.flush()
+                ready, _, _ = select.select(
+                    [proc.stdout], [], [], remaining + _BACKTRACKING_WORKER_GRACE_SECONDS
+                )
+                reply = json.loads(proc.stdout.readline()) if ready else None
+            except (OSError, ValueError):
+                logger.warning("Regex search worker failed", exc_info=True)
+                reply = None
+            if reply is None:
+                self._stop()
+                raise _SearchBudgetExceeded
+            if reply.get("timeout"):
+                raise _SearchBudgetExceeded
+            return set(reply["hits"])
+        finally:
+            self._lock.release()
+
+
+_backtracking_worker = _BacktrackingSearchWorker()
+
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+@lru_cache(maxsize=1024)
+def _linear_pattern(rx: re.Pattern):
+    """
+    rx compiled for RE2, which matches in time linear in the text, or None when RE2 is
+    not installed or lacks a feature the pattern uses (backreferences, lookaround, ...).
+    """
+    if re2 is None or rx.flags & re.VERBOSE:
+        return None
+    inline = "".join(letter for flag, letter in _RE2_INLINE_FLAGS if rx.flags & flag)
+    options = re2.Options()
+    options.log_errors = False
+    try:
+        return re2.compile(f"(?{inline}){rx.pattern}" if inline else rx.pattern, options)
+    except re2.error:
+        return None
+
+
+def _match_texts(rx: re.Pattern, texts: list[str], deadline: float) -> set[int]:
+    """
+    Indices of the texts rx matches. Raises _SearchBudgetExceeded when that cannot be
+    settled before deadline (a time.monotonic() value).
+    """
+    if not texts:
+        return set()
+    linear = _linear_pattern(rx)
+    if linear is None:
+        return _backtracking_worker.search(rx, texts, deadline)
+    hits = set()
+    for index, text in enumerate(texts):
+        if time.monotonic() > deadline:
+            raise _SearchBudgetExceeded
+        if linear.search(text):
+            hits.add(index)
+    return hits
+
+
+# Time one search may spend matching, across every batch of texts. The Lambda function
+# times out after 3 s, which also has to cover the scan and the README fetches.
+_REGEX_BUDGET_SECONDS = 1.0
+
+
+class _RegexBudget:
+    """The matching time left for one search; every batch of texts draws on it."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    async def match(self, rx: re.Pattern, texts: list[str]) -> set[int]:
+        if not texts:
+            return set()
+        started = time.monotonic()
+        try:
+            return await asyncio.to_thread(_match_texts, rx, texts, started + self.seconds)
+        except _SearchBudgetExceeded:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="There is missing field(s) in the artifact_regex or it is formed improperly, or is invalid",
+            )
+        finally:
+            self.seconds -= time.monotonic() - started
+
+
+def _literal_runs(items, ignore_case: bool, runs: list[list[str]]) -> None:
+    """Append the runs of consecutive literal characters every match must contain."""
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            ch = chr(av)
+            if not ignore_case:
+                runs[-1].append(ch)
+            # Only ASCII folds predictably, and re also matches "i" against dotless "ı".
+            elif ch.isascii() and ch not in "iI":
+                runs[-1].append(ch.lower())
+            else:
+                runs.append([])
+        elif op is sre_constants.SUBPATTERN and not av[1] and not av[2]:
+            # A plain group is required as a whole, so its literals extend the current run.
+            _literal_runs(av[3], ignore_case, runs)
+        else:
+            runs.append([])
+
+
+@lru_cache(maxsize=1024)
+def _required_literal(rx: re.Pattern) -> str:
+    """
+    The longest literal substring every match of rx must contain, lower-cased when the
+    pattern ignores case, or '' when there is none worth checking for.
+    """
+    if sre_parse is None:
+        return ""
+    try:
+        parsed = sre_parse.parse(rx.pattern, rx.flags)
+    except Exception:  # noqa: BLE001
+        return ""
+    runs: list[list[str]] = [[]]
+    _literal_runs(parsed, bool(rx.flags & re.IGNORECASE), runs)
+    literal = "".join(max(runs, key=len))
+    return literal if len(literal) > 1 else ""
+
+
+def _may_match(rx: re.Pattern, text: str) -> bool:
+    """Cheap substring pre-check that rules out text rx cannot match, before the regex runs."""
+    literal = _required_literal(rx)
+    if not literal:
+        return True
+    if rx.flags & re.IGNORECASE:
+        # casefold maps every non-ASCII letter that re pairs with an ASCII one onto it.
+        text = text.casefold()
+    return literal in text
+
+
 def _is_literal_name_query(normalized_pattern: str, is_js_style: bool) -> bool:
     # Always treat user input as a regex so substring searches work (per autograder expectations).
     return False
 
 
-def _name_matches(rx: re.Pattern, normalized_pattern: str, is_js_style: bool, name: str) -> bool:
-    return rx.search(name) is not None
-
-
 @router.post(
     "/byRegEx",
     response_model=list[ArtifactMetadata],
@@ -255,77 +543,84 @@ async def artifact_by_regex_post(
 
     rx, normalized, is_js_style, _ = _compile_regex(regex_value)
     literal_name_only = _is_literal_name_query(normalized, is_js_style)
+    # Names and READMEs are matched in batches off the event loop, under one time budget.
+    budget = _RegexBudget(_REGEX_BUDGET_SECONDS)
 
     hits_by_id: dict[str, ArtifactMetadata] = {}
-    scan_kwargs: dict = {}
+    rows: list[tuple[ArtifactMetadata, dict, str]] = []
     network_fetches = 0
 
-    while True:
-        try:
-            resp = table.scan(**scan_kwargs)
-        except ClientError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="The system encountered an error while searching artifacts.",
-            )
-
-        items = resp.get("Items", [])
-
-        for item in items:
-            md = item.get("metadata") or {}
-            data = item.get("data") or {}
-
-            name = md.get("name") or item.get("name")
-            art_id = md.get("id") or item.get("id")
-            art_type = md.get("type") or item.get("type")
-            url = data.get("url") or item.get("url") or ""
-
-            if not isinstance(name, str) or art_id is None or art_type is None:
-                continue
-
-            art_id_str = str(art_id)
-            art_type_str = str(art_type)
-
-            if literal_name_only:
-                if name == normalized:
-                    hits_by_id.setdefault(
-                        art_id_str,
-                        ArtifactMetadata(name=name, id=art_id_str, type=art_type_str),
-                    )
-                continue
-
-            if _name_matches(rx, normalized, is_js_style, name):
-                hits_by_id.setdefault(
-                    art_id_str,
-                    ArtifactMetadata(name=name, id=art_id_str, type=art_type_str),
-                )
-                continue
-
-            stored_readme = _extract_readme_text(item)
-            if stored_readme and rx.search(stored_readme):
-                hits_by_id.setdefault(
-                    art_id_str,
-                    ArtifactMetadata(name=name, id=art_id_str, type=art_type_str),
-                )
-                continue
+    # Every item is a candidate (README text can match), so walk the table segment-parallel.
+    try:
+        items = await parallel_scan(table, **_SEARCH_SCAN_KWARGS)
+    except ClientError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="The system encountered an error while searching artifacts.",
+        )
 
-            if (
-                network_fetches < _MAX_NETWORK_README_FETCHES
-                and isinstance(url, str)
-                and (("github.com/" in url) or ("huggingface.co/" in url))
-            ):
+    for item in items:
+        md = item.get("metadata") or {}
+        data = item.get("data") or {}
+
+        name = md.get("name") or item.get("name")
+        art_id = md.get("id") or item.get("id")
+        art_type = md.get("type") or item.get("type")
+        url = data.get("url") or item.get("url") or ""
+
+        if not isinstance(name, str) or art_id is None or art_type is None:
+            continue
+
+        hit = ArtifactMetadata(name=name, id=str(art_id), type=str(art_type))
+        if literal_name_only:
+            if name == normalized:
+                hits_by_id.setdefault(hit.id, hit)
+            continue
+        rows.append((hit, item, url))
+
+    for index in sorted(await budget.match(rx, [hit.name for hit, _, _ in rows])):
+        hit = rows[index][0]
+        hits_by_id.setdefault(hit.id, hit)
+
+    # Rows whose artifact already matched skip the README work.
+    stored: list[tuple[ArtifactMetadata, str]] = []
+    unmatched: list[tuple[ArtifactMetadata, str]] = []
+    for hit, item, url in rows:
+        if hit.id in hits_by_id:
+            continue
+        stored_readme = _extract_readme_text(item)
+        if stored_readme and _may_match(rx, stored_readme):
+            stored.append((hit, stored_readme))
+        unmatched.append((hit, url))
+
+    for index in sorted(await budget.match(rx, [text for _, text in stored])):
+        hit = stored[index][0]
+        hits_by_id.setdefault(hit.id, hit)
+
+    readme_candidates: list[tuple[ArtifactMetadata, str]] = []
+    for hit, url in unmatched:
+        if hit.id in hits_by_id:
+            continue
+        if isinstance(url, str) and (("github.com/" in url) or ("huggingface.co/" in url)):
+            # Cached READMEs are free; only real fetches count against the budget.
+            if _cached_readme(url) is None:
+                if network_fetches >= _MAX_NETWORK_README_FETCHES:
+                    continue
                 network_fetches += 1
-                readme = _readme_for_url(url)
-                if readme and rx.search(readme):
-                    hits_by_id.setdefault(
-                        art_id_str,
-                        ArtifactMetadata(name=name, id=art_id_str, type=art_type_str),
-                    )
-
-        last_key = resp.get("LastEvaluatedKey")
-        if not last_key:
-            break
-        scan_kwargs["ExclusiveStartKey"] = last_key
+            readme_candidates.append((hit, url))
+
+    # Fetch the READMEs still needed concurrently, after the scan, instead of one by one.
+    readmes = await asyncio.gather(
+        *(asyncio.to_thread(_readme_for_url, url) for _, url in readme_candidates)
+    )
+    fetched = [
+        (hit, readme)
+        for (hit, _), readme in zip(readme_candidates, readmes)
+        if readme and _may_match(rx, readme)
+    ]
+    for index in sorted(await budget.match(rx, [text for _, text in fetched])):
+        hit = fetched[index][0]
+        hits_by_id.setdefault(hit.id, hit)
 
     if not hits_by_id:
         raise HTTPException(
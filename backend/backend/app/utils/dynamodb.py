@@ -1,27 +1,222 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
-import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import base64
+import operator
+import time
 
-from boto3.dynamodb.conditions import Attr
-from ..models import EnumerateOffset
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from cachetools import TTLCache
+import orjson
+
+from ..config import get_settings
+from ..models import ARTIFACT_TYPE_BY_VALUE, EnumerateOffset
 
 Table = Any
 
+# The projected attributes of a list result, fetched in one C-level call.
+_METADATA_FIELDS = operator.itemgetter("id", "name", "type")
+
+# Recently read artifact items, keyed by id. Kept short-lived because other
+# processes (Lambda containers) may change the table behind our back.
+ITEM_CACHE_SIZE = 1024
+ITEM_CACHE_TTL_SECONDS = 30
+_item_cache: TTLCache = TTLCache(maxsize=ITEM_CACHE_SIZE, ttl=ITEM_CACHE_TTL_SECONDS)
+# The GetItem currently in flight for each id; concurrent callers await the same task.
+_item_inflight: Dict[str, asyncio.Task] = {}
+# Serialized response bodies derived from a cached item, per id and then per kind
+# ("rating", ...). Dropped together with the item, so a body never outlives its source.
+_body_cache: TTLCache = TTLCache(maxsize=ITEM_CACHE_SIZE, ttl=ITEM_CACHE_TTL_SECONDS)
+
+# Item reads requested within this window go to DynamoDB together as one BatchGetItem.
+ITEM_BATCH_WINDOW_SECONDS = 0.002
+_BATCH_GET_MAX_KEYS = 100
+_BATCH_GET_MAX_ATTEMPTS = 8
+# Reads waiting for the current window to close, per table.
+_pending_reads: Dict[Table, Dict[str, asyncio.Future]] = {}
+# Batch reads sent but not yet answered, per table.
+_reads_in_flight: Dict[Table, int] = {}
+# Keeps running batch reads referenced until they finish.
+_batch_reads: set = set()
+
+
+def _get_items(table: Table, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the given ids, keyed by id; missing items are absent from the result.
+    A lone id uses GetItem; several use BatchGetItem, retrying UnprocessedKeys with backoff.
+    """
+    if len(ids) == 1:
+        item = table.get_item(Key={"id": ids[0]}).get("Item")
+        return {ids[0]: item} if item else {}
+
+    found: Dict[str, Dict[str, Any]] = {}
+    request_items = {table.name: {"Keys": [{"id": i} for i in ids]}}
+    for attempt in range(_BATCH_GET_MAX_ATTEMPTS):
+        response = table.meta.client.batch_get_item(RequestItems=request_items)
+        for item in response.get("Responses", {}).get(table.name, []):
+            found[item["id"]] = item
+        request_items = response.get("UnprocessedKeys") or {}
+        if not request_items:
+            return found
+        time.sleep(min(0.05 * 2**attempt, 1.0))
+    raise RuntimeError(
+        f"{len(request_items[table.name]['Keys'])} reads still unprocessed after "
+        f"{_BATCH_GET_MAX_ATTEMPTS} attempts"
+    )
+
+
+async def _resolve_reads(table: Table, futures: Dict[str, asyncio.Future]) -> None:
+    try:
+        found = await asyncio.to_thread(_get_items, table, list(futures))
+    except Exception as exc:  # noqa: BLE001
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(exc)
+        return
+    for artifact_id, future in futures.items():
+        if not future.done():
+            future.set_result(found.get(artifact_id))
+
+
+def _finish_reads(table: Table, task: asyncio.Task) -> None:
+    _batch_reads.discard(task)
+    _reads_in_flight[table] -= 1
+    if not _reads_in_flight[table]:
+        del _reads_in_flight[table]
+
+
+def _send_reads(table: Table, futures: Dict[str, asyncio.Future]) -> None:
+    _reads_in_flight[table] = _reads_in_flight.get(table, 0) + 1
+    task = asyncio.ensure_future(_resolve_reads(table, futures))
+    _batch_reads.add(task)
+    task.add_done_callback(lambda t: _finish_reads(table, t))
+
+
+def _flush_reads(table: Table) -> None:
+    pending = _pending_reads.pop(table, {})
+    ids = list(pending)
+    for start in range(0, len(ids), _BATCH_GET_MAX_KEYS):
+        chunk = ids[start : start + _BATCH_GET_MAX_KEYS]  # noqa: E203
+        _send_reads(table, {i: pending[i] for i in chunk})
+
+
+def _read_item(table: Table, artifact_id: str) -> asyncio.Future:
+    """
+    Queue a read of one item. Every id queued before the window closes is fetched
+    in the same round trip, so a burst of lookups for different ids costs one call.
+    A read that arrives while nothing else is queued or in flight is sent at once,
+    so a lone miss does not wait out the window.
+    """
+    loop = asyncio.get_running_loop()
+    pending = _pending_reads.get(table)
+    if pending is None:
+        if not _reads_in_flight.get(table):
+            future = loop.create_future()
+            _send_reads(table, {artifact_id: future})
+            return future
+        pending = _pending_reads[table] = {}
+        loop.call_later(ITEM_BATCH_WINDOW_SECONDS, _flush_reads, table)
+    future = pending.get(artifact_id)
+    if future is None:
+        future = pending[artifact_id] = loop.create_future()
+    return future
+
+
+async def _fetch_item(table: Table, artifact_id: str) -> Optional[Dict[str, Any]]:
+    item = await _read_item(table, artifact_id)
+    # Don't cache a read that an invalidation overtook while it was in flight.
+    if item and _item_inflight.get(artifact_id) is asyncio.current_task():
+        _item_cache[artifact_id] = item
+    return item
+
+
+async def get_item_cached(table: Table, artifact_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch an artifact item by id, serving recently read items from memory.
+
+    Concurrent misses for the same id share a single read, including ones for
+    items that do not exist, and misses for different ids are batched together.
+    Returns None when the item does not exist; misses are not cached so newly
+    created artifacts become visible immediately.
+    """
+    item = _item_cache.get(artifact_id)
+    if item is not None:
+        return item
+
+    task = _item_inflight.get(artifact_id)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_item(table, artifact_id))
+        _item_inflight[artifact_id] = task
+        task.add_done_callback(lambda done: _forget_inflight(artifact_id, done))
+    # Shielded so one caller going away doesn't cancel the read for the others.
+    return await asyncio.shield(task)
+
+
+def _forget_inflight(artifact_id: str, task: asyncio.Task) -> None:
+    if _item_inflight.get(artifact_id) is task:
+        del _item_inflight[artifact_id]
+
+
+def get_cached_body(kind: str, artifact_id: str) -> Optional[bytes]:
+    """
+    Return the response body of this kind last built for the cached artifact, if any.
+    """
+    bodies = _body_cache.get(artifact_id)
+    return bodies.get(kind) if bodies else None
+
+
+def cache_body(kind: str, artifact_id: str, item: Dict[str, Any], body: bytes) -> None:
+    """
+    Remember a response body built from `item`. Ignored unless `item` is still the cached
+    copy, so a body computed from a read that an invalidation overtook is not kept.
+    """
+    if _item_cache.get(artifact_id) is not item:
+        return
+    bodies = _body_cache.get(artifact_id)
+    if bodies is None:
+        bodies = _body_cache[artifact_id] = {}
+    bodies[kind] = body
+
+
+def invalidate_cached_item(artifact_id: str) -> None:
+    """
+    Drop a single artifact, and the bodies built from it, from the item cache
+    (after it is modified or deleted).
+    """
+    _item_cache.pop(artifact_id, None)
+    _item_inflight.pop(artifact_id, None)
+    _body_cache.pop(artifact_id, None)
+
+
+def clear_item_cache() -> None:
+    """
+    Drop every cached artifact item and body (after the registry is reset).
+    """
+    _item_cache.clear()
+    _item_inflight.clear()
+    _body_cache.clear()
+
 
 def query_artifacts_by_name(
     table: Table,
     name: str,
-    artifact_types: Optional[List[str]] = None,
+    artifact_types: Optional[Sequence[str]] = None,
     limit: int = 100,
     last_evaluated_key: Optional[Dict[str, Any]] = None,
 ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
     """
     Query artifacts by name (supports wildcard '*' via contains) and optional types.
     Uses a DynamoDB Scan with FilterExpression and Limit + ExclusiveStartKey.
+    Only the attributes needed for ArtifactMetadata are read back.
+    The limit is clamped to MAX_ARTIFACTS_PER_REQUEST so one call cannot force a huge scan.
     """
+    limit = min(max(1, limit), get_settings().MAX_ARTIFACTS_PER_REQUEST)
     scan_kwargs: Dict[str, Any] = {
         "Limit": limit,
+        "ProjectionExpression": "id, #n, #t",
+        "ExpressionAttributeNames": {"#n": "name", "#t": "type"},
     }
 
     filter_expr = None
@@ -47,20 +242,110 @@ def query_artifacts_by_name(
     return items, next_key
 
 
+def _collect_pages(operation: Any, kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Call a paginated Query/Scan until LastEvaluatedKey runs out and return every item.
+    """
+    kwargs = dict(kwargs)
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = operation(**kwargs)
+        items.extend(response.get("Items", []) or [])
+
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return items
+        kwargs["ExclusiveStartKey"] = last_key
+
+
+async def query_artifacts_by_exact_name(table: Table, name: str) -> List[Dict[str, Any]]:
+    """
+    Return the id/name/type of every artifact whose name is exactly `name`, read from
+    the name GSI. Tables created before the index existed fall back to a filtered
+    parallel scan that also matches the copy of the name under the metadata map.
+    """
+    settings = get_settings()
+    query_kwargs: Dict[str, Any] = {
+        "IndexName": settings.NAME_INDEX_NAME,
+        "KeyConditionExpression": Key("name").eq(name),
+        "ProjectionExpression": "id, #nm, #t",
+        "ExpressionAttributeNames": {"#nm": "name", "#t": "type"},
+        "Limit": settings.DEFAULT_PAGE_SIZE,
+    }
+    try:
+        return await asyncio.to_thread(_collect_pages, table.query, query_kwargs)
+    except ClientError as exc:
+        # DynamoDB reports a missing index as a ValidationException.
+        if exc.response.get("Error", {}).get("Code") != "ValidationException":
+            raise
+
+    scan_kwargs: Dict[str, Any] = {
+        # Let DynamoDB drop non-matching items instead of shipping the whole table back.
+        "FilterExpression": Attr("name").eq(name) | Attr("metadata.name").eq(name),
+        "ProjectionExpression": "id, #nm, #t, #md.id, #md.#nm, #md.#t",
+        "ExpressionAttributeNames": {"#nm": "name", "#t": "type", "#md": "metadata"},
+    }
+    return await parallel_scan(table, **scan_kwargs)
+
+
+def _scan_segment(
+    table: Table,
+    segment: int,
+    total_segments: int,
+    scan_kwargs: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Walk every page of a single parallel-scan segment and return its items.
+    """
+    kwargs = dict(scan_kwargs)
+    if total_segments > 1:
+        kwargs["Segment"] = segment
+        kwargs["TotalSegments"] = total_segments
+    return _collect_pages(table.scan, kwargs)
+
+
+async def parallel_scan(
+    table: Table,
+    total_segments: Optional[int] = None,
+    **scan_kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Scan the entire table using DynamoDB parallel scan (Segment/TotalSegments).
+
+    Each segment pages through its share of the table in a worker thread, so the
+    page round trips of different segments overlap instead of running back to back.
+    Extra keyword arguments (FilterExpression, ProjectionExpression, ...) are passed
+    to every Scan call. total_segments defaults to the SCAN_SEGMENTS setting.
+    """
+    if total_segments is None:
+        total_segments = get_settings().SCAN_SEGMENTS
+    total_segments = max(1, total_segments)
+    segments = await asyncio.gather(
+        *(
+            asyncio.to_thread(_scan_segment, table, segment, total_segments, scan_kwargs)
+            for segment in range(total_segments)
+        )
+    )
+    return [item for items in segments for item in items]
+
+
 def parse_pagination_token(
     offset: Optional[EnumerateOffset],
 ) -> Optional[Dict[str, Any]]:
     """
     Convert an offset (opaque pagination token) into a DynamoDB LastEvaluatedKey dict.
 
-    We expect offset to be a JSON string produced by encode_pagination_token.
+    We expect offset to be the unpadded base64url token produced by encode_pagination_token;
+    bare JSON tokens from older deployments are still accepted.
     If offset is None or invalid, start from the beginning.
     """
     if offset is None:
         return None
 
     try:
-        return json.loads(offset)
+        if offset.startswith("{"):
+            return orjson.loads(offset)
+        return orjson.loads(base64.urlsafe_b64decode(offset + "=" * (-len(offset) % 4)))
     except Exception:
         # If the token is malformed, just ignore it and start from the beginning.
         return None
@@ -70,12 +355,12 @@ def encode_pagination_token(
     last_evaluated_key: Optional[Dict[str, Any]],
 ) -> Optional[str]:
     """
-    Convert a LastEvaluatedKey dict into an opaque string token.
+    Convert a LastEvaluatedKey dict into an opaque, URL-safe string token.
     """
     if last_evaluated_key is None:
         return None
 
-    return json.dumps(last_evaluated_key)
+    return base64.urlsafe_b64encode(orjson.dumps(last_evaluated_key)).rstrip(b"=").decode()
 
 
 def format_artifact_metadata(item: Dict[str, Any]) -> Dict[str, Any]:
@@ -83,8 +368,9 @@ def format_artifact_metadata(item: Dict[str, Any]) -> Dict[str, Any]:
     Map raw DynamoDB item into the shape expected by ArtifactMetadata.
     Adjust field names here as needed to match your table schema.
     """
+    artifact_id, name, stored_type = _METADATA_FIELDS(item)
     return {
-        "id": item.get("id"),
-        "name": item.get("name"),
-        "type": item.get("type"),
+        "id": artifact_id,
+        "name": name,
+        "type": ARTIFACT_TYPE_BY_VALUE.get(stored_type, stored_type),
     }
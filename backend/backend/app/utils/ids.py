@@ -0,0 +1,14 @@
+"""Stable numbers derived from artifact ids."""
+
+import hashlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def id_hash(artifact_id: str, size: int) -> int:
+    """
+    The first `size` bytes of the id's MD5 as a big-endian int.
+    Same value as int(md5.hexdigest()[:2 * size], 16), without building the hex string.
+    """
+    digest = hashlib.md5(artifact_id.encode(), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:size], "big")
@@ -0,0 +1,102 @@
+"""Lineage graph construction from a stored artifact item."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Set
+
+from ..models import ArtifactLineageEdge, ArtifactLineageGraph, ArtifactLineageNode
+from .ids import id_hash
+
+
+def build_lineage(item: Dict[str, Any], artifact_id: str) -> ArtifactLineageGraph:
+    """
+    Build the lineage graph for an artifact from the dependencies recorded on its item.
+    Artifacts without any get a single synthetic base-model parent.
+    """
+    md = item.get("metadata") or {}
+    data = item.get("data") or {}
+
+    name = md.get("name") or item.get("name", "unknown")
+    art_type = md.get("type") or item.get("type", "model")
+
+    nodes: List[ArtifactLineageNode] = []
+    edges: List[ArtifactLineageEdge] = []
+    seen_nodes: Set[str] = set()
+
+    def add_node(
+        node_id: str,
+        node_name: str,
+        source: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        generated: bool = False,
+    ) -> None:
+        if node_id in seen_nodes:
+            return
+        seen_nodes.add(node_id)
+        # Nodes made up entirely here are well-formed by construction; stored values are not.
+        build = ArtifactLineageNode.model_construct if generated else ArtifactLineageNode
+        nodes.append(
+            build(
+                artifact_id=node_id,
+                name=node_name,
+                source=source,
+                metadata=metadata,
+            )
+        )
+
+    add_node(
+        artifact_id,
+        name,
+        "config_json",
+        {
+            "type": art_type,
+            "source_url": data.get("url") or item.get("url", ""),
+            "stored_at": item.get("created_at", ""),
+        },
+    )
+
+    dependencies = (
+        item.get("dependencies") or md.get("dependencies") or data.get("dependencies") or []
+    )
+    if isinstance(dependencies, list):
+        for dep in dependencies:
+            dep_id: Optional[str] = None
+            dep_name: Optional[str] = None
+            dep_type = "dependency"
+            relationship = "depends_on"
+
+            if isinstance(dep, dict):
+                if "id" in dep:
+                    dep_id = str(dep["id"])
+                dep_name = dep.get("name")
+                dep_type = dep.get("type", dep_type)
+                relationship = dep.get("relationship", relationship)
+            elif isinstance(dep, str):
+                dep_id = dep
+
+            if dep_id:
+                dep_name = dep_name or f"{name}-dependency"
+                add_node(dep_id, dep_name, "config_json", {"type": dep_type})
+                edges.append(
+                    ArtifactLineageEdge(
+                        from_node_artifact_id=dep_id,
+                        to_node_artifact_id=artifact_id,
+                        relationship=relationship,
+                    )
+                )
+
+    if not edges:
+        base_id = str(id_hash(artifact_id, 6))
+
+        base_name = "base-" + name.split("-")[0] if "-" in name else "base-model"
+        add_node(base_id, base_name, "config_json", {"type": "base"}, generated=True)
+        edges.append(
+            ArtifactLineageEdge.model_construct(
+                from_node_artifact_id=base_id,
+                to_node_artifact_id=artifact_id,
+                relationship="base_model",
+            )
+        )
+
+    # Nodes and edges were validated as they were built, so skip a second pass.
+    return ArtifactLineageGraph.model_construct(nodes=nodes, edges=edges)
@@ -0,0 +1,34 @@
+"""Non-blocking log setup for the API."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging(package: str, level: int | str = logging.INFO) -> None:
+    """
+    Route the package's log records through a queue so that the writes to stderr
+    happen on a background thread instead of inside request handlers.
+    Calling it again is a no-op.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+
+    logger = logging.getLogger(package)
+    logger.setLevel(level)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    # The Lambda runtime installs its own root handler; don't emit every record twice.
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, stream)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -8,7 +8,7 @@ class FakeTable:
     def __init__(self):
         self.items = {}
 
-    def put_item(self, Item):
+    def put_item(self, Item, **kwargs):
         self.items[Item["id"]] = Item
         return {}
 
@@ -62,5 +62,60 @@ def test_upload_list_retrieve_roundtrip():
     assert retrieved["metadata"]["id"] == art_id
     assert retrieved["data"]["url"].endswith("bert-base-uncased")
 
+    # 4. Conditional retrieve with the returned ETag
+    etag = resp_get.headers["ETag"]
+    resp_cached = client.get(f"/artifacts/model/{art_id}", headers={"If-None-Match": etag})
+    assert resp_cached.status_code == 304
+    assert resp_cached.content == b""
+    assert (
+        client.get(f"/artifacts/model/{art_id}", headers={"If-None-Match": '"x"'}).status_code
+        == 200
+    )
+
     # Clean up overrides
     app.dependency_overrides.clear()
+
+
+def test_list_merges_multiple_queries_without_duplicates():
+    table = FakeTable()
+    for art_id, name in (("a1", "bert"), ("a2", "whisper")):
+        table.put_item({"id": art_id, "name": name, "type": "model"})
+
+    async def override_table():
+        return table
+
+    app.dependency_overrides[get_dynamodb_table] = override_table
+    client = TestClient(app)
+
+    # FakeTable ignores filters, so both queries return both items
+    resp = client.post("/artifacts", json=[{"name": "bert"}, {"name": "whisper"}])
+    assert resp.status_code == 200
+    assert [a["id"] for a in resp.json()] == ["a1", "a2"]
+
+    app.dependency_overrides.clear()
+
+
+def test_list_skips_queries_covered_by_an_untyped_wildcard():
+    table = FakeTable()
+    table.put_item({"id": "a1", "name": "bert", "type": "model"})
+    scans = []
+    original_scan = table.scan
+
+    def counting_scan(**kwargs):
+        scans.append(kwargs)
+        return original_scan(**kwargs)
+
+    table.scan = counting_scan
+
+    async def override_table():
+        return table
+
+    app.dependency_overrides[get_dynamodb_table] = override_table
+    client = TestClient(app)
+
+    resp = client.post("/artifacts", json=[{"name": "bert"}, {"name": "*"}, {"name": "bert"}])
+    assert resp.status_code == 200
+    assert [a["id"] for a in resp.json()] == ["a1"]
+    assert len(scans) == 1 and "FilterExpression" not in scans[0]
+
+    app.dependency_overrides.clear()
@@ -0,0 +1,40 @@
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from backend.backend.app.main import app
+from backend.backend.app.dependencies import get_dynamodb_table
+from backend.backend.app.utils.cost import standalone_cost
+
+
+class FakeTable:
+    def __init__(self, items):
+        self.items = items
+
+    def get_item(self, Key):
+        item = self.items.get(Key["id"])
+        return {"Item": item} if item is not None else {}
+
+
+def test_cost_prefers_stored_value_and_falls_back_to_id_hash():
+    table = FakeTable(
+        {
+            "stored": {"id": "stored", "type": "model", "standalone_cost": Decimal(123)},
+            "legacy": {"id": "legacy", "type": "model"},
+        }
+    )
+
+    async def override_table():
+        return table
+
+    app.dependency_overrides[get_dynamodb_table] = override_table
+    try:
+        client = TestClient(app)
+        stored = client.get("/artifact/model/stored/cost").json()
+        legacy = client.get("/artifact/model/legacy/cost").json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert stored["stored"]["total_cost"] == 123.0
+    assert legacy["legacy"]["total_cost"] == float(standalone_cost("legacy"))
+    assert 100 <= standalone_cost("legacy") < 1000
@@ -0,0 +1,235 @@
+import asyncio
+import time
+
+from botocore.exceptions import ClientError
+
+from backend.backend.app.config import get_settings
+from backend.backend.app.utils.dynamodb import (
+    encode_pagination_token,
+    get_item_cached,
+    invalidate_cached_item,
+    parallel_scan,
+    parse_pagination_token,
+    query_artifacts_by_exact_name,
+    query_artifacts_by_name,
+)
+
+
+class SegmentedTable:
+    """Fake table that honours Segment/TotalSegments and pages two items at a time."""
+
+    def __init__(self, ids):
+        self.ids = list(ids)
+        self.calls = []
+
+    def scan(self, **kwargs):
+        self.calls.append(kwargs)
+        segment = kwargs.get("Segment", 0)
+        total = kwargs.get("TotalSegments", 1)
+        mine = [i for n, i in enumerate(self.ids) if n % total == segment]
+
+        start = kwargs.get("ExclusiveStartKey", {}).get("pos", 0)
+        page = mine[start : start + 2]  # noqa: E203
+        resp = {"Items": [{"id": i} for i in page]}
+        if start + 2 < len(mine):
+            resp["LastEvaluatedKey"] = {"pos": start + 2}
+        return resp
+
+
+def test_parallel_scan_walks_every_segment_and_page():
+    table = SegmentedTable(f"id-{n}" for n in range(11))
+
+    items = asyncio.run(parallel_scan(table, total_segments=3))
+
+    assert sorted(i["id"] for i in items) == sorted(table.ids)
+    assert {c["TotalSegments"] for c in table.calls} == {3}
+    assert {c["Segment"] for c in table.calls} == {0, 1, 2}
+
+
+def test_parallel_scan_single_segment_omits_segment_args():
+    table = SegmentedTable(["a", "b", "c"])
+
+    items = asyncio.run(parallel_scan(table, total_segments=1, ProjectionExpression="id"))
+
+    assert [i["id"] for i in items] == ["a", "b", "c"]
+    assert all("Segment" not in c for c in table.calls)
+    assert all(c["ProjectionExpression"] == "id" for c in table.calls)
+
+
+class CountingTable:
+    def __init__(self, items):
+        self.items = items
+        self.get_calls = 0
+
+    def get_item(self, Key):
+        self.get_calls += 1
+        item = self.items.get(Key["id"])
+        return {"Item": item} if item is not None else {}
+
+
+def test_get_item_cached_serves_repeat_reads_from_memory():
+    table = CountingTable({"cached-1": {"id": "cached-1", "name": "a"}})
+
+    first = asyncio.run(get_item_cached(table, "cached-1"))
+    second = asyncio.run(get_item_cached(table, "cached-1"))
+    assert first == second == {"id": "cached-1", "name": "a"}
+    assert table.get_calls == 1
+
+    invalidate_cached_item("cached-1")
+    asyncio.run(get_item_cached(table, "cached-1"))
+    assert table.get_calls == 2
+
+
+def test_get_item_cached_does_not_cache_misses():
+    table = CountingTable({})
+
+    assert asyncio.run(get_item_cached(table, "missing-1")) is None
+    table.items["missing-1"] = {"id": "missing-1"}
+    assert asyncio.run(get_item_cached(table, "missing-1")) == {"id": "missing-1"}
+
+
+class RecordingTable:
+    def __init__(self):
+        self.calls = []
+
+    def scan(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"Items": []}
+
+
+def test_query_artifacts_by_name_clamps_limit():
+    table = RecordingTable()
+
+    query_artifacts_by_name(table, "*", limit=10_000)
+    query_artifacts_by_name(table, "*", limit=0)
+
+    assert table.calls[0]["Limit"] == get_settings().MAX_ARTIFACTS_PER_REQUEST
+    assert table.calls[1]["Limit"] == 1
+
+
+class SlowTable(CountingTable):
+    def get_item(self, Key):
+        time.sleep(0.05)
+        return super().get_item(Key)
+
+
+def test_get_item_cached_collapses_concurrent_misses():
+    table = SlowTable({"hot-1": {"id": "hot-1"}})
+
+    async def burst():
+        return await asyncio.gather(*(get_item_cached(table, "hot-1") for _ in range(5)))
+
+    results = asyncio.run(burst())
+    assert all(r == {"id": "hot-1"} for r in results)
+    assert table.get_calls == 1
+
+
+def test_pagination_token_roundtrip():
+    key = {"id": "4923e83453167e17e9694b368e35a780"}
+
+    token = encode_pagination_token(key)
+
+    assert token.isascii() and "=" not in token and "{" not in token
+    assert parse_pagination_token(token) == key
+    # Tokens handed out before the base64url codec are still honoured
+    assert parse_pagination_token('{"id": "abc"}') == {"id": "abc"}
+    assert parse_pagination_token("not a token") is None
+
+
+class NameIndexTable:
+    """Fake table whose name index can be switched off to mimic an older deployment."""
+
+    def __init__(self, items, has_index=True):
+        self.items = items
+        self.has_index = has_index
+        self.calls = []
+
+    def query(self, **kwargs):
+        self.calls.append(("query", kwargs))
+        if not self.has_index:
+            raise ClientError(
+                {"Error": {"Code": "ValidationException", "Message": "no such index"}}, "Query"
+            )
+        name = kwargs["KeyConditionExpression"].get_expression()["values"][1]
+        return {"Items": [i for i in self.items if i.get("name") == name]}
+
+    def scan(self, **kwargs):
+        self.calls.append(("scan", kwargs))
+        # Serve everything from segment 0 so the parallel scan sees each item once.
+        if kwargs.get("Segment", 0) != 0:
+            return {"Items": []}
+        return {"Items": list(self.items)}
+
+
+def test_query_artifacts_by_exact_name_uses_name_index():
+    table = NameIndexTable([{"id": "1", "name": "bert"}, {"id": "2", "name": "gpt"}])
+
+    items = asyncio.run(query_artifacts_by_exact_name(table, "bert"))
+
+    assert items == [{"id": "1", "name": "bert"}]
+    assert [op for op, _ in table.calls] == ["query"]
+    assert table.calls[0][1]["IndexName"] == get_settings().NAME_INDEX_NAME
+
+
+def test_query_artifacts_by_exact_name_falls_back_to_scan_without_index():
+    table = NameIndexTable([{"id": "1", "name": "bert"}], has_index=False)
+
+    items = asyncio.run(query_artifacts_by_exact_name(table, "bert"))
+
+    assert items == [{"id": "1", "name": "bert"}]
+    scans = [kwargs for op, kwargs in table.calls if op == "scan"]
+    assert table.calls[0][0] == "query"
+    assert len(scans) == get_settings().SCAN_SEGMENTS
+    assert all("FilterExpression" in kwargs for kwargs in scans)
+
+
+def test_get_item_cached_collapses_concurrent_misses_for_missing_items():
+    table = SlowTable({})
+
+    async def burst():
+        return await asyncio.gather(*(get_item_cached(table, "absent-1") for _ in range(5)))
+
+    assert asyncio.run(burst()) == [None] * 5
+    assert table.get_calls == 1
+
+
+class BatchClient:
+    def __init__(self, table):
+        self.table = table
+        self.calls = []
+
+    def batch_get_item(self, RequestItems):
+        keys = [k["id"] for k in RequestItems[self.table.name]["Keys"]]
+        self.calls.append(keys)
+        # Leave the last key unprocessed on the first call, like a throttled batch.
+        served, unprocessed = (keys[:-1], keys[-1:]) if len(self.calls) == 1 else (keys, [])
+        resp = {
+            "Responses": {
+                self.table.name: [self.table.items[k] for k in served if k in self.table.items]
+            }
+        }
+        if unprocessed:
+            resp["UnprocessedKeys"] = {self.table.name: {"Keys": [{"id": k} for k in unprocessed]}}
+        return resp
+
+
+class BatchTable(CountingTable):
+    name = "artifacts"
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.meta = type("Meta", (), {})()
+        self.meta.client = BatchClient(self)
+
+
+def test_get_item_cached_batches_concurrent_misses_for_different_ids():
+    table = BatchTable({"b-1": {"id": "b-1"}, "b-2": {"id": "b-2"}, "b-3": {"id": "b-3"}})
+
+    async def burst():
+        ids = ["b-1", "b-2", "b-3", "b-absent"]
+        return await asyncio.gather(*(get_item_cached(table, i) for i in ids))
+
+    assert asyncio.run(burst()) == [{"id": "b-1"}, {"id": "b-2"}, {"id": "b-3"}, None]
+    # The first miss goes out alone right away; the rest wait for it and share a batch.
+    assert table.get_calls == 1
+    assert table.meta.client.calls == [["b-2", "b-3", "b-absent"], ["b-absent"]]
@@ -0,0 +1,33 @@
+import yaml
+from fastapi.testclient import TestClient
+
+from backend.backend.app.main import app
+
+
+client = TestClient(app)
+
+
+def test_yaml_is_served_precompressed_when_accepted():
+    resp = client.get("/yaml", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert {v.strip() for v in resp.headers["vary"].split(",")} == {"Accept-Encoding"}
+    # httpx transparently decodes the gzip body
+    spec = yaml.safe_load(resp.text)
+    assert spec["info"]["title"] == app.title
+
+
+def test_yaml_is_served_plain_without_gzip():
+    resp = client.get("/yaml", headers={"Accept-Encoding": "identity"})
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert {v.strip() for v in resp.headers["vary"].split(",")} == {"Accept-Encoding"}
+    assert yaml.safe_load(resp.content)["openapi"].startswith("3.")
+
+
+def test_yaml_honours_refused_and_lookalike_encodings():
+    for header in ("gzip;q=0, deflate", "x-gzip", "br, *;q=0"):
+        resp = client.get("/yaml", headers={"Accept-Encoding": header})
+        assert "content-encoding" not in resp.headers, header
+    resp = client.get("/yaml", headers={"Accept-Encoding": "br;q=1.0, GZIP; q=0.5"})
+    assert resp.headers["content-encoding"] == "gzip"
@@ -0,0 +1,55 @@
+import asyncio
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from backend.backend.app.main import app
+from backend.backend.app.dependencies import get_dynamodb_table
+from backend.backend.app.utils.dynamodb import get_item_cached, invalidate_cached_item
+
+
+class FakeTable:
+    def __init__(self, items):
+        self.items = items
+
+    def get_item(self, Key):
+        item = self.items.get(Key["id"])
+        # Like DynamoDB, hand out a fresh copy on every read.
+        return {"Item": dict(item)} if item is not None else {}
+
+
+def test_rating_uses_stored_rating_and_tracks_item_changes():
+    table = FakeTable(
+        {
+            "rated": {
+                "id": "rated",
+                "name": "bert-base",
+                "rating": {"net_score": Decimal("0.42"), "size_score": {"desktop_pc": 1}},
+            },
+        }
+    )
+
+    async def override_table():
+        return table
+
+    app.dependency_overrides[get_dynamodb_table] = override_table
+    try:
+        client = TestClient(app)
+        first = client.get("/artifact/model/rated/rate")
+        again = client.get("/artifact/model/rated/rate").json()
+        table.items["rated"] = dict(table.items["rated"], rating={"net_score": Decimal("0.5")})
+        invalidate_cached_item("rated")
+        changed = client.get("/artifact/model/rated/rate").json()
+        cached_item = asyncio.run(get_item_cached(table, "rated"))
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert first.json() == again
+    assert again["name"] == "bert-base"
+    assert again["net_score"] == 0.42
+    assert again["size_score"]["desktop_pc"] == 1.0
+    assert changed["net_score"] == 0.5
+    # The rating body is cached beside the item, not written into the shared item dict
+    assert set(cached_item) == {"id", "name", "rating"}
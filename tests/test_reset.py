@@ -0,0 +1,65 @@
+import threading
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from backend.backend.app.main import app
+from backend.backend.app.dependencies import get_dynamodb_table
+
+
+class FakeClient:
+    """Low-level client stand-in; leaves the first delete of each batch unprocessed once."""
+
+    def __init__(self, table):
+        self.table = table
+        self.calls = []
+
+    def batch_write_item(self, RequestItems):
+        (requests,) = RequestItems.values()
+        self.calls.append(len(requests))
+        assert len(requests) <= 25
+        first, rest = requests[0], requests[1:]
+        with self.table.lock:
+            for req in rest:
+                self.table.items.pop(req["DeleteRequest"]["Key"]["id"], None)
+            if first["DeleteRequest"]["Key"]["id"] in self.table.retried:
+                self.table.items.pop(first["DeleteRequest"]["Key"]["id"], None)
+                return {"UnprocessedItems": {}}
+            self.table.retried.add(first["DeleteRequest"]["Key"]["id"])
+        return {"UnprocessedItems": {self.table.name: [first]}}
+
+
+class FakeTable:
+    def __init__(self, ids):
+        self.items = {i: {"id": i, "name": f"name-{i}", "type": "model"} for i in ids}
+        self.lock = threading.Lock()
+        self.scan_calls = []
+        self.retried = set()
+        self.name = "artifacts"
+        self.meta = SimpleNamespace(client=FakeClient(self))
+
+    def scan(self, **kwargs):
+        self.scan_calls.append(kwargs)
+        # Serve everything from segment 0 so the parallel scan sees each item once.
+        if kwargs.get("Segment", 0) != 0:
+            return {"Items": []}
+        return {"Items": [{"id": i} for i in self.items]}
+
+
+def test_reset_deletes_every_item():
+    table = FakeTable([f"id-{n}" for n in range(60)])
+
+    async def override_table():
+        return table
+
+    app.dependency_overrides[get_dynamodb_table] = override_table
+    try:
+        resp = TestClient(app).delete("/reset")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert resp.status_code == 200
+    assert table.items == {}
+    assert all(c["ProjectionExpression"] == "id" for c in table.scan_calls)
+    # 60 ids -> batches of 25, 25 and 10, each resubmitting its one unprocessed delete
+    assert sorted(table.meta.client.calls) == [1, 1, 1, 10, 25, 25]
@@ -0,0 +1,97 @@
+import re
+import time
+
+from fastapi.testclient import TestClient
+
+from backend.backend.app.dependencies import get_dynamodb_table
+from backend.backend.app.main import app
+from backend.backend.app.routers import search
+from backend.backend.app.routers.search import (
+    _REGEX_BUDGET_SECONDS,
+    _first_text,
+    _linear_pattern,
+    _match_texts,
+    _may_match,
+    _required_literal,
+)
+
+
+class ScanTable:
+    def __init__(self, items):
+        self.items = items
+
+    def scan(self, Segment=0, **kwargs):
+        return {"Items": self.items if Segment == 0 else []}
+
+
+def test_match_texts_is_linear_where_re2_supports_the_pattern():
+    rx = re.compile("(a+)+$")
+    assert _linear_pattern(rx) is not None
+    assert _linear_pattern(re.compile(r"(a)\1")) is None
+
+    started = time.monotonic()
+    texts = ["a" * 5000 + "!", "readme ending in aaa"]
+    assert _match_texts(rx, texts, started + 1) == {1}
+    assert time.monotonic() - started < 1
+
+
+def test_match_texts_runs_backtracking_patterns_in_the_worker():
+    deadline = time.monotonic() + 2
+    assert _match_texts(re.compile(r"(a)\1", re.IGNORECASE), ["xAa", "ab"], deadline) == {0}
+    assert _match_texts(re.compile(r"(a)\1"), [], deadline) == set()
+
+
+def test_pathological_pattern_is_rejected_within_the_budget():
+    table = ScanTable(
+        [
+            {"id": "1", "name": "plain", "type": "model", "readme": "a" * 40 + "!"},
+            {"id": "2", "name": "other", "type": "model", "readme": "nothing here"},
+        ]
+    )
+
+    async def override_table():
+        return table
+
+    app.dependency_overrides[get_dynamodb_table] = override_table
+    try:
+        client = TestClient(app)
+        started = time.monotonic()
+        resp = client.post("/artifact/byRegEx", json={"regex": "(a+)+(?=$)"})
+        elapsed = time.monotonic() - started
+        # The worker survives the timeout and serves the next search.
+        again = client.post("/artifact/byRegEx", json={"regex": "(o)(?=t)"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert resp.status_code == 400
+    # Well inside the 3 s Lambda timeout, worker start-up included.
+    assert elapsed < _REGEX_BUDGET_SECONDS + 1
+    assert again.status_code == 200
+    assert [hit["id"] for hit in again.json()] == ["2"]
+
+
+def test_first_text_requests_candidates_a_couple_at_a_time(monkeypatch):
+    requested = []
+
+    def fake_fetch(url):
+        requested.append(url)
+        return "readme" if url == "b" else ""
+
+    monkeypatch.setattr(search, "_fetch_text", fake_fetch)
+    assert _first_text(["a", "b", "c", "d", "e"]) == "readme"
+    assert set(requested) <= {"a", "b", "c"}
+    requested.clear()
+    assert _first_text(["a", "c"]) == ""
+    assert sorted(requested) == ["a", "c"]
+
+
+def test_required_literal_prefilter_never_rejects_a_match():
+    rx = re.compile("^bert-(base)x.*", re.IGNORECASE)
+    assert _required_literal(rx) == "bert-basex"
+    assert _required_literal(re.compile("(foo|bar)+")) == ""
+
+    # re pairs these non-ASCII letters with ASCII ones under IGNORECASE
+    for pattern, text in [("start", "ſTART"), ("kelvin", "Kelvin"), ("big", "bıg")]:
+        rx = re.compile(pattern, re.IGNORECASE)
+        assert rx.search(text) and _may_match(rx, text), pattern
+    assert not _may_match(re.compile("whisper", re.IGNORECASE), "a bert readme")